@@ -2,8 +2,10 @@
 # New test suites (unit, integration) are now active.
 # E2E tests are still under development.
 
-collect_ignore_glob = [
-    "tests/e2e/*",
-    "prototypes/*",
-    "tools/*",
+# Directory entries (not globs) so collection prunes these trees at the
+# directory boundary instead of matching every file inside them.
+collect_ignore = [
+    "tests/e2e",
+    "prototypes",
+    "tools",
 ]
@@ -16,11 +16,26 @@ Integration plan:
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    # Optional: renders DOT in-process through libgvc instead of running dot
+    import pygraphviz
+
+    PYGRAPHVIZ_AVAILABLE = True
+except ImportError:
+    PYGRAPHVIZ_AVAILABLE = False
 
 # DDD Layer Definitions
 DDD_LAYERS = {
@@ -84,27 +99,78 @@ DDD_SUBDOMAINS = {
     },
 }
 
+# Prefix tuples for str.startswith, which tests every prefix in one C call
+_LAYER_PREFIXES = {layer_id: tuple(layer_info["modules"]) for layer_id, layer_info in DDD_LAYERS.items()}
+_SUBDOMAIN_PREFIXES = tuple(DDD_SUBDOMAINS)
+_LAYER_SUBDOMAINS = {
+    layer_id: [s for s in DDD_SUBDOMAINS if s.startswith(prefixes)] for layer_id, prefixes in _LAYER_PREFIXES.items()
+}
+
+# Cluster headers depend only on the constants above, so render them once
+_LAYER_HEADER = {
+    layer_id: (
+        f'  subgraph "cluster_{layer_id}" {{\n'
+        f'    label="{layer_info["name"]}";\n'
+        "    style=filled;\n"
+        f'    color="{layer_info["color"]}";\n'
+        "    fontsize=16;\n"
+        f'    tooltip="{layer_info["description"]}";\n'
+    )
+    for layer_id, layer_info in DDD_LAYERS.items()
+}
+_SUBDOMAIN_HEADER = {
+    subdomain_path: (
+        f'    subgraph "cluster_{subdomain_path.replace("/", "_").replace(".", "_")}" {{\n'
+        f'      label="{subdomain_info["name"]}";\n'
+        "      style=filled;\n"
+        f'      color="{subdomain_info["color"]}";\n'
+        "      fontsize=14;\n"
+        f'      tooltip="{subdomain_info["description"]}";\n'
+    )
+    for subdomain_path, subdomain_info in DDD_SUBDOMAINS.items()
+}
+
+_GVC_LOCK = threading.Lock()
 
-def install_dependencies():
-    """Install required dependencies automatically."""
+# Marker of a successful dependency check, trusted for a week
+DEPS_MARKER = Path.home() / ".cache" / "mancer" / "visualize_ddd_deps_ok"
+DEPS_MARKER_TTL = 7 * 24 * 3600
+
+# Node and edge statements in the DOT output of "tach show"
+_DOT_NODE_RE = re.compile(r'"([^"]+)"\s*\[')
+_DOT_EDGE_RE = re.compile(r'"([^"]+)"\s*->\s*"([^"]+)"')
+
+
+def install_dependencies(need_tach=True):
+    """Install required dependencies automatically.
+
+    A successful full check is remembered in DEPS_MARKER for DEPS_MARKER_TTL
+    seconds, during which warm runs skip the probes altogether.
+    """
     dependencies = ["graphviz"]
 
     try:
+        if time.time() - os.path.getmtime(DEPS_MARKER) < DEPS_MARKER_TTL:
+            return
+    except OSError:
+        pass
 
-        # Special handling for tach
-        try:
-            subprocess.run(["tach", "--version"], check=True, capture_output=True)
-            print("Found tach installation.")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Installing tach...")
-            subprocess.run([sys.executable, "-m", "pip", "install", "tach"], check=True)
-            # Verify installation
-            try:
-                subprocess.run(["tach", "--version"], check=True, capture_output=True)
-                print("Tach installed successfully.")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                print("Error: Failed to install tach. Please install it manually with 'pip install tach'.")
-                sys.exit(1)
+    try:
+
+        # Special handling for tach (not needed when modules are enumerated directly)
+        if need_tach:
+            if shutil.which("tach") is not None:
+                print("Found tach installation.")
+            else:
+                print("Installing tach...")
+                subprocess.run([sys.executable, "-m", "pip", "install", "tach"], check=True)
+                # Verify installation
+                try:
+                    subprocess.run(["tach", "--version"], check=True, capture_output=True)
+                    print("Tach installed successfully.")
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    print("Error: Failed to install tach. Please install it manually with 'pip install tach'.")
+                    sys.exit(1)
 
         # Install other dependencies
         for dep in dependencies:
@@ -154,6 +220,14 @@ def install_dependencies():
         print(f"Error installing dependencies: {str(e)}")
         sys.exit(1)
 
+    # Only a run that also verified tach may vouch for later runs
+    if need_tach:
+        try:
+            DEPS_MARKER.parent.mkdir(parents=True, exist_ok=True)
+            DEPS_MARKER.touch()
+        except OSError:
+            pass  # The marker only skips future checks - an unwritable cache dir is not an error
+
 
 def get_operating_system():
     """Detect the operating system."""
@@ -167,33 +241,72 @@ def get_operating_system():
         return "unknown"
 
 
-def run_tach_analysis():
-    """Run tach analysis and return data as JSON."""
-    try:
-        # Create a temporary file for the dependency map
-        import tempfile
+def _tree_fingerprint(root="src/mancer"):
+    """Digest of (path, mtime, size) of every file under root."""
+    digest = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Bytecode churn must not invalidate the cache
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as temp_file:
-            temp_path = temp_file.name
 
-        # Run tach map to get dependency information
-        print("Running tach map to get dependency information...")
-        map_result = subprocess.run(
-            ["tach", "map", "--output", temp_path],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+def run_tach_analysis(cache_file=None):
+    """Run tach analysis and return data as JSON.
 
-        # Read the dependency map
+    When cache_file is given the result is reused as long as the source tree
+    fingerprint has not changed.
+    """
+    if cache_file is None:
+        return _run_tach()
+
+    fingerprint = _tree_fingerprint()
+    try:
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+        if cached.get("fp") == fingerprint:
+            print("Source tree unchanged, reusing cached tach analysis.")
+            return cached["data"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    data = _run_tach()
+
+    # Write to a temporary file and swap it in so a crash never leaves a torn cache
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump({"fp": fingerprint, "data": data}, f)
+    os.replace(tmp_file, cache_file)
+    return data
+
+
+def _tach_output(subcommand, out_flag, suffix, marker):
+    """Run a tach subcommand and return the content it writes to its output.
+
+    Output is read from stdout ("-" as the path). Only when stdout does not
+    contain marker is the command rerun with a file in a temporary directory
+    that is removed afterwards.
+    """
+    result = subprocess.run(["tach", subcommand, out_flag, "-"], check=True, capture_output=True, text=True)
+    if marker in result.stdout:
+        return result.stdout
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, f"tach_{subcommand}{suffix}")
+        subprocess.run(["tach", subcommand, out_flag, temp_path], check=True, capture_output=True, text=True)
         with open(temp_path, "r") as f:
-            dependency_data = json.load(f)
+            return f.read()
 
-        # Clean up the temporary file
-        try:
-            os.remove(temp_path)
-        except:
-            pass
+
+def _run_tach():
+    """Run tach and transform its output into the generate_dot_file format."""
+    try:
+        # Run tach map to get dependency information
+        print("Running tach map to get dependency information...")
+        dependency_data = json.loads(_tach_output("map", "--output", ".json", "{"))
 
         # Transform the data into the format expected by generate_dot_file
         transformed_data = {"modules": {}, "dependencies": []}
@@ -221,51 +334,25 @@ def run_tach_analysis():
         # Try alternative approach with tach show if map failed
         try:
             print("Trying alternative approach with tach show...")
-            with tempfile.NamedTemporaryFile(suffix=".dot", delete=False) as temp_file:
-                temp_path = temp_file.name
-
-            show_result = subprocess.run(
-                ["tach", "show", "--out", temp_path],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            dot_content = _tach_output("show", "--out", ".dot", "digraph")
 
             # Since tach show generates a DOT file, we need to extract module info from it
             modules = {}
             dependencies = []
 
-            with open(temp_path, "r") as f:
-                dot_content = f.read()
-
-            # Extract module names from node definitions in DOT file
-            import re
-
-            # Find module nodes
-            node_pattern = re.compile(r'"([^"]+)"\s*\[')
-            for match in node_pattern.finditer(dot_content):
-                module_name = match.group(1)
-                modules[module_name] = {}
-
-            # Find dependencies from edges
-            edge_pattern = re.compile(r'"([^"]+)"\s*->\s*"([^"]+)"')
-            for match in edge_pattern.finditer(dot_content):
-                from_module = match.group(1)
-                to_module = match.group(2)
-                dependencies.append({"from": from_module, "to": to_module, "count": 1})
-
-            # Clean up
-            try:
-                os.remove(temp_path)
-            except:
-                pass
+            # Extract module nodes and dependency edges line by line
+            for line in dot_content.splitlines():
+                for match in _DOT_NODE_RE.finditer(line):
+                    modules[match.group(1)] = {}
+                for match in _DOT_EDGE_RE.finditer(line):
+                    dependencies.append({"from": match.group(1), "to": match.group(2), "count": 1})
 
             return {"modules": modules, "dependencies": dependencies}
 
         except Exception as e2:
             print(f"Alternative approach also failed: {e2}")
-            print("Please make sure your project structure is compatible with tach.")
-            sys.exit(1)
+            print("Falling back to listing modules without dependency information.")
+            return enumerate_modules_fast()
     except json.JSONDecodeError as e:
         print(f"Error processing JSON output from tach: {e}")
         sys.exit(1)
@@ -274,200 +361,237 @@ def run_tach_analysis():
         sys.exit(1)
 
 
+def enumerate_modules_fast(root="src/mancer"):
+    """List package directories under root without running tach.
+
+    Only module names are produced, no dependency edges. os.scandir reports
+    entry types from readdir, so no per-file stat is needed.
+    """
+    modules = []
+    pending = [root]
+    while pending:
+        path = pending.pop()
+        has_python = False
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    has_python = True
+        if has_python:
+            modules.append(path.replace(os.sep, "/"))
+
+    return {"modules": {module_path: {} for module_path in sorted(modules)}, "dependencies": []}
+
+
 def generate_dot_file(tach_data, output_file, detailed=False):
     """Generate DOT file from tach analysis."""
     modules = tach_data.get("modules", {})
     dependencies = tach_data.get("dependencies", [])
 
-    # Filter modules to only include Mancer-related paths
-    valid_modules = {}
-    for module_path in modules:
-        if "src/mancer" in module_path:
-            valid_modules[module_path] = modules[module_path]
+    # Filter modules to only include Mancer paths, and edges to those between them
+    valid_modules = {module_path: info for module_path, info in modules.items() if module_path.startswith("src/mancer")}
+    valid_dependencies = [
+        dep for dep in dependencies if dep.get("from") in valid_modules and dep.get("to") in valid_modules
+    ]
+
+    # Derive DOT node ids and labels once per path (keys are always "/"-separated)
+    node_ids = {module_path: module_path.replace("/", "_").replace(".", "_") for module_path in valid_modules}
+    basenames = {module_path: module_path.rsplit("/", 1)[-1] for module_path in valid_modules}
+    module_node_ids = {node_ids[module_path] for module_path in valid_modules}
+
+    # Assign every module to its layer and longest matching subdomain in one pass
+    longest_first_subdomains = sorted(DDD_SUBDOMAINS, key=len, reverse=True)
+    modules_by_layer = {layer_id: [] for layer_id in DDD_LAYERS}
+    modules_by_layer_direct = {layer_id: [] for layer_id in DDD_LAYERS}
+    modules_by_subdomain = {subdomain_path: [] for subdomain_path in DDD_SUBDOMAINS}
+    for module_path in valid_modules:
+        layer_id = next((lid for lid, prefixes in _LAYER_PREFIXES.items() if module_path.startswith(prefixes)), None)
+        if layer_id is None:
+            continue
+        modules_by_layer[layer_id].append(module_path)
+        if not module_path.startswith(_SUBDOMAIN_PREFIXES):
+            modules_by_layer_direct[layer_id].append(module_path)
+            continue
+        subdomain_path = next(s for s in longest_first_subdomains if module_path.startswith(s))
+        modules_by_subdomain[subdomain_path].append(module_path)
+
+    # Collect the DOT source and write it in one go
+    buf = []
+    # Start of DOT file
+    buf.append(
+        'digraph "Mancer DDD Architecture" {\n'
+        '  rankdir="TB";\n'
+        '  node [shape=box, style=filled, fontname="Arial"];\n'
+        '  edge [fontname="Arial", fontsize=10];\n'
+        "  compound=true;\n\n"
+    )
 
-    # Filter dependencies to only include Mancer-related paths
-    valid_dependencies = []
-    for dep in dependencies:
-        from_module = dep.get("from", "")
-        to_module = dep.get("to", "")
-        if "src/mancer" in from_module and "src/mancer" in to_module:
-            valid_dependencies.append(dep)
+    # Define subgraphs for DDD layers
+    for layer_id, layer_info in DDD_LAYERS.items():
+        buf.append(_LAYER_HEADER[layer_id])
+
+        # If detailed diagram, add subdomains
+        if detailed:
+            # Process subdomains for this layer
+            for subdomain_path in _LAYER_SUBDOMAINS[layer_id]:
+                subdir_id = subdomain_path.replace("/", "_").replace(".", "_")
+                buf.append(_SUBDOMAIN_HEADER[subdomain_path])
+
+                # Add modules belonging to this subdomain
+                for module_path in modules_by_subdomain[subdomain_path]:
+                    module_id = node_ids[module_path]
+                    buf.append(f'      "{module_id}" [label="{basenames[module_path]}", tooltip="{module_path}"];\n')
+
+                # If no modules found for this subdomain, add a placeholder
+                if not modules_by_subdomain[subdomain_path]:
+                    placeholder_id = f"{subdir_id}_placeholder"
+                    buf.append(
+                        f'      "{placeholder_id}" [label="{subdomain_path.rsplit("/", 1)[-1]}", tooltip="{subdomain_path}", style="dashed,filled", fillcolor="#f5f5f5"];\n'
+                    )
 
-    with open(output_file, "w") as f:
-        # Start of DOT file
-        f.write('digraph "Mancer DDD Architecture" {\n')
-        f.write('  rankdir="TB";\n')
-        f.write('  node [shape=box, style=filled, fontname="Arial"];\n')
-        f.write('  edge [fontname="Arial", fontsize=10];\n')
-        f.write("  compound=true;\n\n")
-
-        # Define subgraphs for DDD layers
-        for layer_id, layer_info in DDD_LAYERS.items():
-            f.write(f'  subgraph "cluster_{layer_id}" {{\n')
-            f.write(f'    label="{layer_info["name"]}";\n')
-            f.write("    style=filled;\n")
-            f.write(f'    color="{layer_info["color"]}";\n')
-            f.write("    fontsize=16;\n")
-            f.write(f'    tooltip="{layer_info["description"]}";\n')
-
-            # If detailed diagram, add subdomains
-            if detailed:
-                # First, collect all modules for this layer
-                layer_modules = {}
-                for module_path in valid_modules:
-                    if any(module_path.startswith(m) for m in layer_info["modules"]):
-                        layer_modules[module_path] = valid_modules[module_path]
-
-                # Process subdomains for this layer
-                for subdomain_path, subdomain_info in DDD_SUBDOMAINS.items():
-                    if any(subdomain_path.startswith(m) for m in layer_info["modules"]):
-                        subdir_id = subdomain_path.replace("/", "_").replace(".", "_")
-                        f.write(f'    subgraph "cluster_{subdir_id}" {{\n')
-                        f.write(f'      label="{subdomain_info["name"]}";\n')
-                        f.write("      style=filled;\n")
-                        f.write(f'      color="{subdomain_info["color"]}";\n')
-                        f.write("      fontsize=14;\n")
-                        f.write(f'      tooltip="{subdomain_info["description"]}";\n')
-
-                        # Add modules belonging to this subdomain
-                        subdomain_module_added = False
-                        for module_path in layer_modules:
-                            if module_path.startswith(subdomain_path):
-                                module_id = module_path.replace("/", "_").replace(".", "_")
-                                f.write(
-                                    f'      "{module_id}" [label="{os.path.basename(module_path)}", tooltip="{module_path}"];\n'
-                                )
-                                subdomain_module_added = True
-
-                        # If no modules found for this subdomain, add a placeholder
-                        if not subdomain_module_added:
-                            placeholder_id = f"{subdir_id}_placeholder"
-                            f.write(
-                                f'      "{placeholder_id}" [label="{os.path.basename(subdomain_path)}", tooltip="{subdomain_path}", style="dashed,filled", fillcolor="#f5f5f5"];\n'
-                            )
+                buf.append("    }\n\n")
 
-                        f.write("    }\n\n")
+            # Add modules that don't belong to any subdomain directly to the layer
+            for module_path in modules_by_layer_direct[layer_id]:
+                module_id = node_ids[module_path]
+                buf.append(f'    "{module_id}" [label="{basenames[module_path]}", tooltip="{module_path}"];\n')
+
+        # For simple diagram, just add all modules for this layer
+        else:
+            for module_path in modules_by_layer[layer_id]:
+                module_id = node_ids[module_path]
+                buf.append(f'    "{module_id}" [label="{basenames[module_path]}", tooltip="{module_path}"];\n')
+
+            # If no modules found for this layer, add a placeholder
+            if not modules_by_layer[layer_id]:
+                placeholder_id = f"{layer_id}_placeholder"
+                buf.append(
+                    f'    "{placeholder_id}" [label="{layer_info["name"]}", tooltip="No modules found", style="dashed,filled", fillcolor="#f5f5f5"];\n'
+                )
 
-                # Add modules that don't belong to any subdomain directly to the layer
-                for module_path in layer_modules:
-                    if not any(module_path.startswith(s) for s in DDD_SUBDOMAINS):
-                        module_id = module_path.replace("/", "_").replace(".", "_")
-                        f.write(
-                            f'    "{module_id}" [label="{os.path.basename(module_path)}", tooltip="{module_path}"];\n'
-                        )
+        buf.append("  }\n\n")
 
-            # For simple diagram, just add all modules for this layer
-            else:
-                layer_module_added = False
-                for module_path in valid_modules:
-                    if any(module_path.startswith(m) for m in layer_info["modules"]):
-                        module_id = module_path.replace("/", "_").replace(".", "_")
-                        f.write(
-                            f'    "{module_id}" [label="{os.path.basename(module_path)}", tooltip="{module_path}"];\n'
-                        )
-                        layer_module_added = True
-
-                # If no modules found for this layer, add a placeholder
-                if not layer_module_added:
-                    placeholder_id = f"{layer_id}_placeholder"
-                    f.write(
-                        f'    "{placeholder_id}" [label="{layer_info["name"]}", tooltip="No modules found", style="dashed,filled", fillcolor="#f5f5f5"];\n'
-                    )
+    # Add dependencies
+    for dep in valid_dependencies:
+        from_module = node_ids[dep.get("from", "")]
+        to_module = node_ids[dep.get("to", "")]
+        count = dep.get("count", 0)
 
-            f.write("  }\n\n")
+        # Add edge with weight
+        buf.append(f'  "{from_module}" -> "{to_module}" [label="{count}", weight={count}];\n')
 
-        # Add dependencies
-        for dep in valid_dependencies:
-            from_module = dep.get("from", "").replace("/", "_").replace(".", "_")
-            to_module = dep.get("to", "").replace("/", "_").replace(".", "_")
-            count = dep.get("count", 0)
+    # Add special edges for showing DDD pattern
+    buf.append("\n  # DDD pattern dependencies\n")
+    interface_node = "src_mancer_interface"
+    application_node = "src_mancer_application"
+    domain_node = "src_mancer_domain"
+    infrastructure_node = "src_mancer_infrastructure"
 
-            # Add edge with weight
-            f.write(f'  "{from_module}" -> "{to_module}" [label="{count}", weight={count}];\n')
+    # Check if nodes exist, if not use placeholders
+    if interface_node not in module_node_ids:
+        interface_node = "interface_placeholder"
+        buf.append(f'  "{interface_node}" [label="Interface Layer", style="invis"];\n')
 
-        # Add special edges for showing DDD pattern
-        f.write("\n  # DDD pattern dependencies\n")
-        interface_node = "src_mancer_interface"
-        application_node = "src_mancer_application"
-        domain_node = "src_mancer_domain"
-        infrastructure_node = "src_mancer_infrastructure"
+    if application_node not in module_node_ids:
+        application_node = "application_placeholder"
+        buf.append(f'  "{application_node}" [label="Application Layer", style="invis"];\n')
 
-        # Check if nodes exist, if not use placeholders
-        if not any(module.replace("/", "_").replace(".", "_") == interface_node for module in valid_modules):
-            interface_node = "interface_placeholder"
-            f.write(f'  "{interface_node}" [label="Interface Layer", style="invis"];\n')
+    if domain_node not in module_node_ids:
+        domain_node = "domain_placeholder"
+        buf.append(f'  "{domain_node}" [label="Domain Layer", style="invis"];\n')
 
-        if not any(module.replace("/", "_").replace(".", "_") == application_node for module in valid_modules):
-            application_node = "application_placeholder"
-            f.write(f'  "{application_node}" [label="Application Layer", style="invis"];\n')
+    if infrastructure_node not in module_node_ids:
+        infrastructure_node = "infrastructure_placeholder"
+        buf.append(f'  "{infrastructure_node}" [label="Infrastructure Layer", style="invis"];\n')
 
-        if not any(module.replace("/", "_").replace(".", "_") == domain_node for module in valid_modules):
-            domain_node = "domain_placeholder"
-            f.write(f'  "{domain_node}" [label="Domain Layer", style="invis"];\n')
+    buf.append(f'  "{interface_node}" -> "{application_node}" [color="#1f78b4", style=dashed, penwidth=2];\n')
+    buf.append(f'  "{application_node}" -> "{domain_node}" [color="#1f78b4", style=dashed, penwidth=2];\n')
+    buf.append(f'  "{domain_node}" -> "{infrastructure_node}" [color="#1f78b4", style=dashed, penwidth=2];\n')
 
-        if not any(module.replace("/", "_").replace(".", "_") == infrastructure_node for module in valid_modules):
-            infrastructure_node = "infrastructure_placeholder"
-            f.write(f'  "{infrastructure_node}" [label="Infrastructure Layer", style="invis"];\n')
+    # End of DOT file
+    buf.append("}\n")
 
-        f.write(f'  "{interface_node}" -> "{application_node}" [color="#1f78b4", style=dashed, penwidth=2];\n')
-        f.write(f'  "{application_node}" -> "{domain_node}" [color="#1f78b4", style=dashed, penwidth=2];\n')
-        f.write(f'  "{domain_node}" -> "{infrastructure_node}" [color="#1f78b4", style=dashed, penwidth=2];\n')
+    with open(output_file, "w") as f:
+        f.write("".join(buf))
 
-        # End of DOT file
-        f.write("}\n")
 
+def generate_diagrams_batched(dot_files, format="png"):
+    """Render several DOT files with a single dot process.
+
+    dot -O names each output <input>.<format>; the results are renamed to
+    <input without .dot>.<format>, e.g. mancer_ddd.png, as before. When
+    pygraphviz is installed the files are laid out and rendered in-process
+    through libgvc instead, without spawning dot at all.
+    """
+    outputs = [f"{os.path.splitext(dot_file)[0]}.{format}" for dot_file in dot_files]
+
+    if PYGRAPHVIZ_AVAILABLE:
+        for dot_file, output_file in zip(dot_files, outputs):
+            # libgvc is not thread-safe and main() renders the legend on a worker thread
+            with _GVC_LOCK:
+                graph = pygraphviz.AGraph(dot_file)
+                graph.layout(prog="dot")
+                graph.draw(output_file, format=format)
+            print(f"Diagram generated: {output_file}")
+        return outputs
 
-def generate_diagram(dot_file, output_file, format="png"):
-    """Generate diagram from DOT file."""
     try:
-        subprocess.run(["dot", f"-T{format}", dot_file, f"-o{output_file}"], check=True)
-        print(f"Diagram generated: {output_file}")
+        subprocess.run(["dot", f"-T{format}", "-O", *dot_files], check=True)
     except subprocess.CalledProcessError as e:
         print(f"Error generating diagram: {e}")
         sys.exit(1)
 
+    for dot_file, output_file in zip(dot_files, outputs):
+        os.replace(f"{dot_file}.{format}", output_file)
+        print(f"Diagram generated: {output_file}")
+    return outputs
+
 
-def generate_legend(output_dir, format="png"):
-    """Generate legend explaining colors and layers."""
+def generate_legend(output_dir):
+    """Write the DOT source of the legend explaining colors and layers."""
     legend_dot = os.path.join(output_dir, "legend.dot")
-    legend_output = os.path.join(output_dir, f"legend.{format}")
 
-    with open(legend_dot, "w") as f:
-        f.write('digraph "Mancer DDD Legend" {\n')
-        f.write('  node [shape=box, style=filled, fontname="Arial"];\n')
-        f.write('  rankdir="TB";\n\n')
+    buf = []
+    buf.append('digraph "Mancer DDD Legend" {\n')
+    buf.append('  node [shape=box, style=filled, fontname="Arial"];\n')
+    buf.append('  rankdir="TB";\n\n')
 
-        # Title
-        f.write('  label="Mancer DDD Architecture - Legend";\n')
-        f.write("  fontsize=20;\n")
-        f.write('  labelloc="t";\n\n')
+    # Title
+    buf.append('  label="Mancer DDD Architecture - Legend";\n')
+    buf.append("  fontsize=20;\n")
+    buf.append('  labelloc="t";\n\n')
 
-        # Layers
-        f.write("  subgraph cluster_layers {\n")
-        f.write('    label="DDD Layers";\n')
-        f.write('    style="rounded";\n\n')
+    # Layers
+    buf.append("  subgraph cluster_layers {\n")
+    buf.append('    label="DDD Layers";\n')
+    buf.append('    style="rounded";\n\n')
+
+    for i, (layer_id, layer_info) in enumerate(DDD_LAYERS.items()):
+        buf.append(
+            f'    layer_{i} [label="{layer_info["name"]}", fillcolor="{layer_info["color"]}", tooltip="{layer_info["description"]}"];\n'
+        )
 
-        for i, (layer_id, layer_info) in enumerate(DDD_LAYERS.items()):
-            f.write(
-                f'    layer_{i} [label="{layer_info["name"]}", fillcolor="{layer_info["color"]}", tooltip="{layer_info["description"]}"];\n'
-            )
+    buf.append("  }\n\n")
 
-        f.write("  }\n\n")
+    # Subdomains
+    buf.append("  subgraph cluster_subdomains {\n")
+    buf.append('    label="Subdomains";\n')
+    buf.append('    style="rounded";\n\n')
 
-        # Subdomains
-        f.write("  subgraph cluster_subdomains {\n")
-        f.write('    label="Subdomains";\n')
-        f.write('    style="rounded";\n\n')
+    for i, (subdomain_path, subdomain_info) in enumerate(DDD_SUBDOMAINS.items()):
+        buf.append(
+            f'    subdomain_{i} [label="{subdomain_info["name"]}", fillcolor="{subdomain_info["color"]}", tooltip="{subdomain_info["description"]}"];\n'
+        )
 
-        for i, (subdomain_path, subdomain_info) in enumerate(DDD_SUBDOMAINS.items()):
-            f.write(
-                f'    subdomain_{i} [label="{subdomain_info["name"]}", fillcolor="{subdomain_info["color"]}", tooltip="{subdomain_info["description"]}"];\n'
-            )
+    buf.append("  }\n")
+    buf.append("}\n")
 
-        f.write("  }\n")
-        f.write("}\n")
+    with open(legend_dot, "w") as f:
+        f.write("".join(buf))
 
-    generate_diagram(legend_dot, legend_output, format)
+    return legend_dot
 
 
 def open_diagram(diagram_path):
@@ -499,13 +623,18 @@ def main():
         help="Output format",
     )
     parser.add_argument("--detailed", action="store_true", help="Generate detailed diagram")
+    parser.add_argument(
+        "--no-tach",
+        action="store_true",
+        help="List modules directly from src/mancer instead of running tach (no dependency edges)",
+    )
     args = parser.parse_args()
 
     print("==== Mancer DDD Architecture Visualizer ====")
 
     # Install dependencies if needed
     print("Checking and installing dependencies...")
-    install_dependencies()
+    install_dependencies(need_tach=not args.no_tach)
 
     # Create output directory if it doesn't exist
     os.makedirs(args.output_dir, exist_ok=True)
@@ -514,22 +643,32 @@ def main():
     dot_file = os.path.join(args.output_dir, "mancer_ddd.dot")
     diagram_output = os.path.join(args.output_dir, f"mancer_ddd.{args.format}")
 
-    # Analyze project using tach
-    print("Analyzing project with tach...")
-    tach_data = run_tach_analysis()
-
-    # Generate DOT file
-    print(f"Generating DOT file: {dot_file}")
-    generate_dot_file(tach_data, dot_file, args.detailed)
+    # The legend does not depend on the analysis, so render it while tach runs
+    print("Generating legend...")
+    legend_dot = generate_legend(args.output_dir)
 
-    # Generate diagram
-    if args.format != "dot":
-        print(f"Generating {args.format} diagram: {diagram_output}")
-        generate_diagram(dot_file, diagram_output, args.format)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        legend_future = None
+        if args.format != "dot":
+            legend_future = executor.submit(generate_diagrams_batched, [legend_dot], args.format)
 
-    # Generate legend
-    print("Generating legend...")
-    generate_legend(args.output_dir, args.format)
+        # Analyze project using tach
+        if args.no_tach:
+            print("Listing modules from src/mancer...")
+            tach_data = enumerate_modules_fast()
+        else:
+            print("Analyzing project with tach...")
+            tach_data = run_tach_analysis(os.path.join(args.output_dir, ".tach_cache.json"))
+
+        # Generate DOT file
+        print(f"Generating DOT file: {dot_file}")
+        generate_dot_file(tach_data, dot_file, args.detailed)
+
+        # Generate diagram
+        if args.format != "dot":
+            print(f"Generating {args.format} diagram: {diagram_output}")
+            generate_diagrams_batched([dot_file], args.format)
+            legend_future.result()
 
     print("\nVisualization completed successfully!")
     print(f"Output files have been saved to: {os.path.abspath(args.output_dir)}")
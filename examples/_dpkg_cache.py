@@ -0,0 +1,96 @@
+"""
+Pamięć podręczna bazy dpkg dla przykładów.
+
+Zamiast uruchamiać `dpkg -S <plik>` i `dpkg-query` przy każdym zapytaniu, pełna mapa
+plik -> pakiet oraz pakiet -> wersja są ładowane jednorazowo, a kolejne zapytania
+są obsługiwane ze słownika w pamięci.
+"""
+
+import functools
+import os
+from typing import Dict, Tuple
+
+from mancer.application.shell_runner import ShellRunner
+
+
+@functools.lru_cache(maxsize=1)
+def _runner() -> ShellRunner:
+    """Zwraca runner używany do odczytu bazy dpkg (bez cache wyników - mapy są cache'owane tutaj)"""
+    return ShellRunner(backend_type="bash", enable_cache=False, enable_command_logging=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _file_map() -> Dict[str, str]:
+    """Ładuje mapę plik -> pakiet jednym wywołaniem `dpkg -S '*'`"""
+    result = _runner().execute_script("dpkg -S '*' 2>/dev/null")
+    file_map: Dict[str, str] = {}
+    for line in result.raw_output.splitlines():
+        # Linie "diversion by ..." opisują przekierowania, nie właścicieli plików
+        if line.startswith("diversion "):
+            continue
+        packages, sep, path = line.partition(": ")
+        if sep:
+            # Pierwszy pakiet z listy, bez kwalifikatora architektury (np. "libc6:amd64")
+            file_map.setdefault(path, packages.split(",", 1)[0].split(":", 1)[0].strip())
+    return file_map
+
+
+@functools.lru_cache(maxsize=1)
+def _version_map() -> Dict[str, str]:
+    """Ładuje mapę pakiet -> wersja jednym wywołaniem `dpkg-query -W`"""
+    result = _runner().execute_script("dpkg-query -W -f='${Package} ${Version}\\n' 2>/dev/null")
+    versions: Dict[str, str] = {}
+    for line in result.raw_output.splitlines():
+        package, _, version = line.partition(" ")
+        if version:
+            versions[package] = version
+    return versions
+
+
+@functools.lru_cache(maxsize=None)
+def package_of(cmd_path: str) -> str:
+    """
+    Zwraca nazwę pakietu, do którego należy plik.
+
+    Args:
+        cmd_path: Ścieżka do pliku (np. wynik `command -v chronyd`)
+
+    Returns:
+        str: Nazwa pakietu lub pusty tekst, jeśli plik nie należy do żadnego pakietu
+    """
+    file_map = _file_map()
+    candidates = [cmd_path, os.path.realpath(cmd_path)]
+    # Przy scalonym /usr dpkg zna często /bin/x, a PATH zwraca /usr/bin/x
+    candidates += [path[len("/usr") :] for path in candidates if path.startswith("/usr/")]
+    for path in candidates:
+        if path in file_map:
+            return file_map[path]
+    return ""
+
+
+def package_version(package: str) -> str:
+    """
+    Zwraca zainstalowaną wersję pakietu.
+
+    Args:
+        package: Nazwa pakietu
+
+    Returns:
+        str: Wersja pakietu lub pusty tekst, jeśli pakiet nie jest zainstalowany
+    """
+    return _version_map().get(package, "")
+
+
+@functools.lru_cache(maxsize=None)
+def package_files(package: str) -> Tuple[str, ...]:
+    """
+    Zwraca listę plików pakietu (`dpkg -L`), pobieraną raz dla każdego pakietu.
+
+    Args:
+        package: Nazwa pakietu
+
+    Returns:
+        Tuple[str, ...]: Ścieżki plików pakietu (pusta krotka, jeśli pakiet nie jest zainstalowany)
+    """
+    result = _runner().execute_script(f"dpkg -L {package} 2>/dev/null")
+    return tuple(line for line in result.raw_output.splitlines() if line.startswith("/"))
@@ -1,10 +1,45 @@
-from typing import Optional
+import copy
+import functools
+import io
+import shutil
+from itertools import islice
+from typing import Iterator, Optional
+
+from _dpkg_cache import package_files, package_of, package_version
 
 from mancer.application.commands.apt_command import AptCommand
 from mancer.application.commands.systemctl_command import SystemctlCommand
 from mancer.application.shell_runner import ShellRunner
 
 
+@functools.lru_cache(maxsize=None)
+def which(name: str) -> Optional[str]:
+    """
+    Zwraca ścieżkę polecenia z PATH (odpowiednik `command -v`) bez uruchamiania powłoki.
+
+    Args:
+        name: Nazwa polecenia
+
+    Returns:
+        Optional[str]: Pełna ścieżka lub None, jeśli polecenie nie jest dostępne
+    """
+    return shutil.which(name)
+
+
+def _head_lines(text: str, count: int) -> Iterator[str]:
+    """
+    Zwraca leniwie pierwsze linie tekstu - bez dzielenia całego wyjścia na listę.
+
+    Args:
+        text: Tekst wielowierszowy
+        count: Liczba linii do zwrócenia
+
+    Returns:
+        Iterator[str]: Pierwsze linie tekstu bez znaków nowej linii
+    """
+    return (line.rstrip("\n") for line in islice(io.StringIO(text), count))
+
+
 ## WIP
 def check_and_install_chronyd(runner: ShellRunner, sudo_password: Optional[str] = None) -> bool:
     """
@@ -24,16 +59,17 @@ def check_and_install_chronyd(runner: ShellRunner, sudo_password: Optional[str]
     print(f"Sprawdzanie czy polecenie {DAEMON_NAME} jest dostępne w systemie...")
 
     # Sprawdź czy apt wymaga aktualizacji
+    # Metody buildera AptCommand modyfikują instancję - każde wywołanie dostaje płytką kopię bazowej komendy
     apt = AptCommand().with_sudo(sudo_password)
     print("Sprawdzanie, czy apt wymaga aktualizacji...")
-    result = runner.execute(apt.needsUpdate())
+    result = runner.execute(copy.copy(apt).needsUpdate())
     if result.success:
         needs_update = result.raw_output.strip().startswith("TRUE")
         print(f"Status aktualizacji apt: {result.raw_output.strip()}")
 
         if needs_update:
             print("Wykonywanie aktualizacji apt...")
-            update_result = runner.execute(apt.update())
+            update_result = runner.execute(copy.copy(apt).update())
             if not update_result.success:
                 print(f"Błąd podczas aktualizacji apt: {update_result.error_message}")
 
@@ -42,42 +78,36 @@ def check_and_install_chronyd(runner: ShellRunner, sudo_password: Optional[str]
 
     # Używamy dedykowanej metody z AptCommand do odświeżania informacji o blokadzie
     print("")  # Dodaj pustą linię przed wyświetlaniem informacji o statusie
-    result = runner.execute_live(apt.refresh_if_locked(max_attempts=10, sleep_time=3, timeout=10))
+    result = runner.execute_live(copy.copy(apt).refresh_if_locked(max_attempts=10, sleep_time=3, timeout=10))
     if not result.success:
         print("Apt jest zablokowany przez inny proces. Nie można kontynuować.")
         return False
 
-    # Najpierw sprawdźmy czy polecenie chronyd jest dostępne w systemie
+    # Ścieżkę polecenia ustalamy w procesie (shutil.which), pakiet i wersję z cache dpkg
     print(f"Sprawdzanie czy polecenie {DAEMON_NAME} jest dostępne...")
-    command_check = runner.execute(
-        ShellRunner.create_bash_command(f"command -v {DAEMON_NAME} >/dev/null 2>&1 && echo 'TRUE' || echo 'FALSE'")
-    )
+    daemon_path = which(DAEMON_NAME)
 
-    if command_check.success and command_check.raw_output.strip() == "TRUE":
+    if daemon_path:
         print(f"Polecenie {DAEMON_NAME} jest dostępne w systemie!")
 
         # Sprawdźmy, do jakiego pakietu należy to polecenie
-        package_check = runner.execute(
-            ShellRunner.create_bash_command(f"dpkg -S $(which {DAEMON_NAME}) 2>/dev/null | cut -d: -f1")
-        )
-        if package_check.success and package_check.raw_output.strip():
-            actual_package = package_check.raw_output.strip()
+        actual_package = package_of(daemon_path)
+        if actual_package:
             print(f"Polecenie {DAEMON_NAME} pochodzi z pakietu: {actual_package}")
-
-            # Pobierzmy wersję pakietu
-            ver_result = runner.execute(apt.get_package_version(actual_package))
-            if ver_result.success:
-                print(f"Zainstalowana wersja: {ver_result.raw_output.strip()}")
+            installed_version = package_version(actual_package)
+            if installed_version:
+                print(f"Zainstalowana wersja: {installed_version}")
 
             return True
 
     # Sprawdź czy pakiet, który powinien zawierać chronyd, jest dostępny w repozytoriach
     print(f"Polecenie {DAEMON_NAME} nie jest dostępne. Sprawdzam dostępność pakietu {PACKAGE_NAME}...")
+    # Wynik sprawdzenia niesie kod wyjścia apt-cache - wyjście jest od razu kierowane do /dev/null
     package_available = runner.execute(
-        ShellRunner.create_bash_command(f"apt-cache show {PACKAGE_NAME} >/dev/null 2>&1 && echo 'TRUE' || echo 'FALSE'")
+        runner.create_bash_command(f"apt-cache show {PACKAGE_NAME}", discard_stdout=True, discard_stderr=True)
     )
 
-    if package_available.success and package_available.raw_output.strip() == "FALSE":
+    if package_available.exit_code != 0:
         print(f"Pakiet {PACKAGE_NAME} nie istnieje w repozytoriach. Nie można zainstalować polecenia {DAEMON_NAME}.")
         return False
 
@@ -89,21 +119,17 @@ def check_and_install_chronyd(runner: ShellRunner, sudo_password: Optional[str]
     if not sudo_password and "sudo" not in apt._options:
         print("UWAGA: Instalacja pakietu wymaga uprawnień sudo!")
 
-    result = runner.execute(apt.install(PACKAGE_NAME))
+    result = runner.execute(copy.copy(apt).install(PACKAGE_NAME))
 
     if result.success:
         # Sprawdźmy czy pakiet faktycznie został zainstalowany
-        verify_result = runner.execute(apt.isInstalled(PACKAGE_NAME))
+        verify_result = runner.execute(copy.copy(apt).isInstalled(PACKAGE_NAME))
         if verify_result.success and verify_result.raw_output.strip().startswith("TRUE"):
             print(f"Pakiet {PACKAGE_NAME} został pomyślnie zainstalowany!")
 
-            # Sprawdźmy czy polecenie chronyd jest teraz dostępne
-            command_check = runner.execute(
-                ShellRunner.create_bash_command(
-                    f"command -v {DAEMON_NAME} >/dev/null 2>&1 && echo 'TRUE' || echo 'FALSE'"
-                )
-            )
-            if command_check.success and command_check.raw_output.strip() == "TRUE":
+            # Sprawdźmy czy pakiet dostarczył polecenie chronyd - z listy plików pakietu (dpkg -L),
+            # bez ponownego przeszukiwania PATH
+            if any(path.endswith(f"/{DAEMON_NAME}") for path in package_files(PACKAGE_NAME)):
                 print(f"Polecenie {DAEMON_NAME} jest teraz dostępne w systemie!")
             else:
                 print(
@@ -112,12 +138,12 @@ def check_and_install_chronyd(runner: ShellRunner, sudo_password: Optional[str]
                 print("Może być potrzebna dodatkowa konfiguracja lub inny pakiet.")
 
             # Pobierz zainstalowaną wersję
-            ver_result = runner.execute(apt.get_package_version(PACKAGE_NAME))
+            ver_result = runner.execute(copy.copy(apt).get_package_version(PACKAGE_NAME))
             if ver_result.success:
                 print(f"Zainstalowana wersja: {ver_result.raw_output.strip()}")
 
             # Pobierz listę poleceń dostarczanych przez pakiet
-            cmd_result = runner.execute(apt.get_commands_for_package(PACKAGE_NAME))
+            cmd_result = runner.execute(copy.copy(apt).get_commands_for_package(PACKAGE_NAME))
             if cmd_result.success:
                 print("Polecenia dostarczane przez pakiet:")
                 for line in cmd_result.raw_output.strip().split("\n")[1:]:  # Pomiń pierwszy wiersz z nagłówkiem
@@ -145,7 +171,7 @@ def main():
     runner = ShellRunner(
         backend_type="bash",
         enable_cache=True,
-        cache_max_size=100,
+        cache_size=100,
         enable_live_output=True,  # Włączamy wyświetlanie wyjścia w czasie rzeczywistym
     )
 
@@ -161,57 +187,61 @@ def main():
 
     # Pokaż przykłady innych komend apt
     print("\nPrzykłady innych komend apt:")
+
+    # Zapytania są od siebie niezależne - wykonujemy je równolegle, a wyniki wyświetlamy po kolei.
+    # AptCommand modyfikuje instancję w metodach buildera, więc każde zapytanie dostaje kopię
+    # bazowej komendy (copy.copy nie wczytuje ponownie pliku stanu apt, w przeciwieństwie do AptCommand()).
+    # Strumieniowanie wyjścia na żywo wyłączamy, żeby równoległe wyjścia się nie przeplatały.
+    runner.enable_live_output = False
     apt = AptCommand().with_sudo(sudo_password)
+    queries = [
+        copy.copy(apt).getLastUpdateTime(),
+        copy.copy(apt).get_updates_count(),
+        copy.copy(apt).get_repository_status(),
+        SystemctlCommand().with_sudo(sudo_password).status("chrony"),
+        copy.copy(apt).list_upgradable_packages(),
+    ]
+    last_update, updates_count, repo_status, chrony_status, upgradable = runner.execute_batch(queries)
 
     # Sprawdź czas ostatniej aktualizacji apt
     print("\nSprawdzanie czasu ostatniej aktualizacji apt:")
-    result = runner.execute(apt.getLastUpdateTime())
-    if result.success:
-        print(f"Ostatnia aktualizacja apt: {result.raw_output.strip()}")
+    if last_update.success:
+        print(f"Ostatnia aktualizacja apt: {last_update.raw_output.strip()}")
 
     # Pobierz liczbę dostępnych aktualizacji
     print("\nSprawdzanie liczby dostępnych aktualizacji:")
-    result = runner.execute(apt.get_updates_count())
-    if result.success:
-        print(f"Liczba dostępnych aktualizacji: {result.raw_output.strip()}")
+    if updates_count.success:
+        print(f"Liczba dostępnych aktualizacji: {updates_count.raw_output.strip()}")
 
     # Sprawdź status repozytoriów
     print("\nSprawdzanie statusu repozytoriów apt:")
-    result = runner.execute(apt.get_repository_status())
-    if result.success:
+    if repo_status.success:
         print("Status repozytoriów:")
-        lines = result.raw_output.split("\n")
-        # Wyświetl tylko pierwsze 3 linie wyników
-        for i, line in enumerate(lines):
-            if i < 3:
-                print(f"  {line}")
-        if len(lines) > 3:
-            print(f"  ... oraz {len(lines)-3} więcej linii")
+        # Wyświetl tylko pierwsze 3 linie wyników (bez budowania listy wszystkich linii)
+        for line in _head_lines(repo_status.raw_output, 3):
+            print(f"  {line}")
+        line_count = repo_status.raw_output.count("\n") + 1
+        if line_count > 3:
+            print(f"  ... oraz {line_count - 3} więcej linii")
 
     # Sprawdź status usługi chronyd
     print("\nSprawdzanie statusu usługi chronyd:")
-    systemctl = SystemctlCommand().with_sudo(sudo_password)
-    result = runner.execute(systemctl.status("chrony"))
-    if result.success:
+    if chrony_status.success:
         print("Status usługi chronyd:")
-        lines = result.raw_output.split("\n")
         # Wyświetl pierwsze 5 linii statusu
-        for i, line in enumerate(lines):
-            if i < 5:
-                print(f"  {line}")
+        for line in _head_lines(chrony_status.raw_output, 5):
+            print(f"  {line}")
 
     # Sprawdź listę pakietów do aktualizacji
     print("\nLista pakietów do aktualizacji:")
-    result = runner.execute(apt.list_upgradable_packages())
-    if result.success:
-        lines = result.raw_output.split("\n")
-        if len(lines) > 1:  # Więcej niż nagłówek
+    if upgradable.success:
+        line_count = upgradable.raw_output.count("\n") + 1
+        if line_count > 1:  # Więcej niż nagłówek
             # Wyświetl tylko pierwsze 5 linii wyników
-            for i, line in enumerate(lines):
-                if i < 5:
-                    print(f"  {line}")
-            if len(lines) > 5:
-                print(f"  ... oraz {len(lines)-5} więcej pakietów")
+            for line in _head_lines(upgradable.raw_output, 5):
+                print(f"  {line}")
+            if line_count > 5:
+                print(f"  ... oraz {line_count - 5} więcej pakietów")
         else:
             print("  Brak pakietów do aktualizacji")
 
@@ -23,49 +23,56 @@ from src.mancer.infrastructure.command.system.ps_command import PsCommand
 
 def display_result_info(result, title="Command Result"):
     """Display information about command result including data format and history"""
+    # Local aliases - this helper runs after every command, keep name lookups cheap
+    _print = print
+    _len = len
     try:
-        print(f"\n=== {title} ===")
-        print(f"Success: {'✓' if result.is_success() else '✗'}")
-        print(f"Data format: {result.data_format}")
-        print(f"Exit code: {result.exit_code}")
+        _print(f"\n=== {title} ===")
+        _print(f"Success: {'✓' if result.is_success() else '✗'}")
+        _print(f"Data format: {result.data_format}")
+        _print(f"Exit code: {result.exit_code}")
 
         # Display the command that was executed
         history = result.get_history()
-        if history and history.get_steps_count() > 0:
-            last_step = history.get_last_step()
-            if last_step:
-                print(f"Executed command: {last_step.command_string}")
-                print(f"Command type: {last_step.command_type}")
+        steps = history.steps if history else None
+        if steps:
+            last_step = steps[-1]
+            _print(f"Executed command: {last_step.command_string}")
+            _print(f"Command type: {last_step.command_type}")
 
         # Display a sample of the output
-        print("\nOutput sample:")
-        if result.raw_output:
-            lines = result.raw_output.strip().split("\n")
-            for i, line in enumerate(lines[:2]):  # Show only first 2 lines
-                print(f"  {line}")
-            if len(lines) > 2:
-                print("  ...")
+        _print("\nOutput sample:")
+        raw_output = result.raw_output
+        if raw_output:
+            lines = raw_output.strip().split("\n", 2)  # Only the first 2 lines are shown
+            for line in lines[:2]:
+                _print(f"  {line}")
+            if _len(lines) > 2:
+                _print("  ...")
         else:
-            print("  (No raw output)")
+            _print("  (No raw output)")
 
         # Display structured data sample
-        print("\nStructured data sample:")
-        if result.structured_output is not None and len(result.structured_output) > 0:
+        _print("\nStructured data sample:")
+        # structured_output may be a DataFrame, whose truth value is ambiguous - compare the length
+        structured = result.structured_output
+        count = _len(structured) if structured is not None else 0
+        if count > 0:
             try:
-                for i, item in enumerate(result.structured_output[:1]):  # Show only first item
-                    print(f"  Item 1: {str(item)[:150]}")  # Limit string length
-                if len(result.structured_output) > 1:
-                    print("  ...")
+                for item in structured[:1]:  # Show only first item
+                    _print(f"  Item 1: {str(item)[:150]}")  # Limit string length
+                if count > 1:
+                    _print("  ...")
             except Exception as e:
-                print(f"  Error displaying structured data: {str(e)}")
+                _print(f"  Error displaying structured data: {str(e)}")
         else:
-            print("  (No structured data)")
+            _print("  (No structured data)")
 
         # Flush output to ensure it's displayed immediately
         sys.stdout.flush()
 
     except Exception as e:
-        print(f"\nError displaying result info: {str(e)}")
+        _print(f"\nError displaying result info: {str(e)}")
         sys.stdout.flush()
 
 
@@ -3,16 +3,43 @@ import time
 
 from mancer.application.shell_runner import ShellRunner
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_preview(data, limit=500):
+    """Return the first `limit` characters of the indented JSON dump of data"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()[
+                :limit
+            ]
+        except TypeError:
+            pass  # Fall back to the stdlib encoder below
+
+    # iterencode produces the dump piece by piece - stop once the preview is long enough
+    chunks = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2, default=str).iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(chunks)[:limit]
+
 
 def main():
     # Initialize runner with cache enabled
     runner = ShellRunner(
         backend_type="bash",
         enable_cache=True,
-        cache_max_size=200,
-        cache_auto_refresh=True,
-        cache_refresh_interval=10,
+        cache_size=200,
     )
+    runner.enable_cache(max_size=200, auto_refresh=True, refresh_interval=10)
 
     print("=== Cache Usage Demonstration in ShellRunner ===\n")
 
@@ -36,34 +63,34 @@ def main():
     # Get cache statistics
     print("\nCache statistics after first execution:")
     stats = runner.get_cache_statistics()
-    print(json.dumps(stats, indent=2))
+    print(json.dumps(stats, separators=(",", ":")))  # Compact - the full summary is printed at the end
 
     # Execute the same command again - result should be retrieved from cache
     print("\nExecuting the same command again (should use cache):")
-    start_time = time.time()
+    # perf_counter_ns is monotonic and has the resolution needed for a cache hit (microseconds)
+    start_ns = time.perf_counter_ns()
     result2 = runner.execute(ls)
-    end_time = time.time()
-    print(f"Execution time: {(end_time - start_time)*1000:.2f} ms")
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    print(f"Execution time: {elapsed_ms:.3f} ms")
     print(f"Status: {'Success' if result2.success else 'Error'}")
 
-    # Execute new commands
+    # Execute new commands - they are independent and read-only, so run them concurrently
+    # and print the results in order (the processes overlap while Python waits on them)
+    result3, result4, result5, result_head = runner.execute_batch([df, echo, cat, head])
+
     print("\nExecuting 'df -h' command:")
-    result3 = runner.execute(df)
     print(f"Status: {'Success' if result3.success else 'Error'}")
     print(f"Result: {result3.raw_output[:200]}...")  # Showing only the beginning of the result
 
     print("\nExecuting 'echo Hello from cache example!' command:")
-    result4 = runner.execute(echo)
     print(f"Status: {'Success' if result4.success else 'Error'}")
     print(f"Result: {result4.raw_output}")
 
     print("\nExecuting 'cat /etc/hostname' command:")
-    result5 = runner.execute(cat)
     print(f"Status: {'Success' if result5.success else 'Error'}")
     print(f"Result: {result5.raw_output}")
 
     print("\nExecuting 'head -n 5 /etc/passwd' command:")
-    result_head = runner.execute(head)
     print(f"Status: {'Success' if result_head.success else 'Error'}")
     print(f"Result: {result_head.raw_output}")
 
@@ -84,14 +111,14 @@ def main():
     # Export cache data to JSON
     print("\nExporting cache data (without results):")
     cache_data = runner.export_cache_data(include_results=False)
-    print(json.dumps(cache_data, indent=2, default=str)[:500] + "...")
+    print(json_preview(cache_data, 500) + "...")
 
     # Demonstrate cache clearing
     print("\nClearing cache...")
     runner.clear_cache()
     print("Statistics after clearing:")
     stats = runner.get_cache_statistics()
-    print(json.dumps(stats, indent=2))
+    print(json.dumps(stats, separators=(",", ":")))  # Compact - the full summary is printed at the end
 
     # Demonstrate disabling and enabling cache
     print("\nDisabling cache...")
@@ -1,12 +1,28 @@
 import json
 import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from mancer.application.shell_runner import ShellRunner
 
 # Usunięto całą sekcję importu matplotlib
 VISUALIZATION_AVAILABLE = False
 
+# Niepuste linie tekstu - wyszukiwane leniwie, bez kopiowania i dzielenia całego wyjścia
+NON_EMPTY_LINE = re.compile(r"^.*\S.*$", re.MULTILINE)
+
+
+def output_preview(output, max_lines):
+    """Zwraca pierwsze niepuste linie wyjścia oraz liczbę linii, które po nich pozostały"""
+    matches = list(islice(NON_EMPTY_LINE.finditer(output), max_lines))
+    if not matches:
+        return [], 0
+    # Liczymy znaki nowej linii za fragmentem, pomijając ostatni znak końca wyjścia
+    end = len(output) - 1 if output.endswith("\n") else len(output)
+    return [match.group() for match in matches], output.count("\n", matches[-1].end(), end)
+
 
 def simulate_commands(runner, count=20, interval=0.5):
     """Symuluje wykonanie różnych komend dla celów demonstracyjnych"""
@@ -25,53 +41,56 @@ def simulate_commands(runner, count=20, interval=0.5):
         runner.create_command("head").lines(5).file("/etc/passwd"),
     ]
 
-    for i in range(count):
-        cmd = random.choice(commands)
+    # Typ i pełne polecenie każdej komendy są stałe - wyznaczamy je raz, przed pętlą
+    cmd_meta = []
+    for cmd in commands:
+        cmd_name = getattr(cmd, "name", "unknown")
+        cmd_string = cmd.build_command() if hasattr(cmd, "build_command") else str(cmd)
+        cmd_meta.append((cmd, runner.get_command_type_name(cmd_name), cmd_string))
 
-        # Pobierz nazwę polecenia przed wykonaniem
-        cmd_name = cmd.name if hasattr(cmd, "name") else "unknown"
-        cmd_type = runner.get_command_type_name(cmd_name)
+    # Losujemy od razu całą sekwencję komend jednym wywołaniem
+    picks = random.choices(cmd_meta, k=count)
 
-        # Pobierz pełne polecenie
-        cmd_string = cmd.build_command() if hasattr(cmd, "build_command") else str(cmd)
+    # Komendy uruchamiamy w puli wątków co `interval` sekund - czekanie na proces nie blokuje
+    # kolejnych uruchomień (cache runnera jest chroniony blokadą), a wyniki wypisujemy w kolejności
+    futures = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for cmd, _, cmd_string in picks:
+            print(f"Wykonuję komendę: {cmd_string}")
+            futures.append(executor.submit(runner.execute, cmd))
+            time.sleep(interval)
+    print()
 
-        # Wykonujemy komendę z dodatkowymi metadanymi
-        print(f"Wykonuję komendę: {cmd_string}")
-        result = runner.execute(cmd)
+    for i, ((_, cmd_type, _), future) in enumerate(zip(picks, futures)):
+        result = future.result()
 
         print(f"Wykonano komendę {i+1}/{count}: {cmd_type}")
         print(f"  Status: {'Sukces' if result.is_success() else 'Błąd'}")
         print(f"  Exit Code: {result.exit_code}")
         if result.raw_output:
             # Jeśli jest wyjście, wyświetl pierwsze 3 linie (lub mniej)
-            output_lines = result.raw_output.strip().split("\n")
-            if output_lines and output_lines[0]:
-                sample = "\n    ".join(output_lines[:3])
-                print(f"  Wyjście (fragment): {sample}")
-                if len(output_lines) > 3:
-                    print(f"    ... (oraz {len(output_lines) - 3} więcej linii)")
+            sample, remaining = output_preview(result.raw_output, 3)
+            if sample:
+                sample_text = "\n    ".join(sample)
+                print(f"  Wyjście (fragment): {sample_text}")
+                if remaining:
+                    print(f"    ... (oraz {remaining} więcej linii)")
         print()
 
-        time.sleep(interval)
-
 
 def main():
     # Inicjalizacja runnera z włączonym cache
-    runner = ShellRunner(
-        backend_type="bash",
-        enable_cache=True,
-        cache_max_size=200,
-        cache_auto_refresh=True,
-        cache_refresh_interval=10,
-        language="pl",  # Ustawiamy język polski dla nazw komend
-    )
+    runner = ShellRunner(backend_type="bash", enable_cache=True, cache_size=200)
+    runner.enable_cache(max_size=200, auto_refresh=True, refresh_interval=10)
+    language = "pl"
+    runner.set_language(language)  # Ustawiamy język polski dla nazw komend
 
     print("=== Demonstracja cache w ShellRunner (z obsługą języków) ===\n")
 
     # Wyświetlamy dostępne języki
     available_languages = runner.get_available_languages()
     print(f"Dostępne języki: {', '.join(available_languages)}")
-    print(f"Aktualny język: {runner.language}\n")
+    print(f"Aktualny język: {language}\n")
 
     # Symulujemy komendy
     print("Symulacja wykonania komend...")
@@ -84,7 +103,9 @@ def main():
 
     # Wyświetlamy historię komend
     print("\nHistoria wykonanych komend:")
-    history = runner.get_command_history()
+    history = runner.get_cache_history()
+    # Wyniki wszystkich komend z historii pobieramy z cache jednym wywołaniem
+    cached_results = runner.get_cached_results([cmd_id for cmd_id, _, _ in history])
 
     for i, (cmd_id, timestamp, success) in enumerate(history):
         # Wyświetlamy podstawowe informacje
@@ -93,7 +114,7 @@ def main():
         print(f"   Status: {'Sukces' if success else 'Błąd'}")
 
         # Pobieramy wynik z cache
-        result = runner.get_cached_result(cmd_id)
+        result = cached_results.get(cmd_id)
         if result and hasattr(result, "metadata") and result.metadata:
             # Pobieramy typ komendy z metadanych
             cmd_type = result.metadata.get("command_type", "unknown")
@@ -104,16 +125,17 @@ def main():
             print(f"   Typ komendy: {polish_cmd_name}")
             print(f"   Polecenie: {cmd_string}")
 
+        if result:
             # Wyświetlamy exit code i fragmenty wyniku
             print(f"   Exit Code: {result.exit_code}")
             if result.raw_output:
                 # Jeśli jest wyjście, wyświetl pierwsze 2 linie (lub mniej)
-                output_lines = result.raw_output.strip().split("\n")
-                if output_lines and output_lines[0]:
-                    sample = "\n    ".join(output_lines[:2])
-                    print(f"   Wyjście (fragment): {sample}")
-                    if len(output_lines) > 2:
-                        print(f"    ... (oraz {len(output_lines) - 2} więcej linii)")
+                sample, remaining = output_preview(result.raw_output, 2)
+                if sample:
+                    sample_text = "\n    ".join(sample)
+                    print(f"   Wyjście (fragment): {sample_text}")
+                    if remaining:
+                        print(f"    ... (oraz {remaining} więcej linii)")
         print()
 
     # Przykład zmiany języka
@@ -42,7 +42,7 @@ class MojaKomenda(BaseCommand):
     """Przykładowa własna komenda"""
 
     def __init__(self, nazwa: str = "moja-komenda"):
-        super().__init__(nazwa)
+        super().__init__(name=nazwa)
 
     def execute(self, context: CommandContext, input_result=None):
         """Implementacja metody execute"""
@@ -52,12 +52,12 @@ class MojaKomenda(BaseCommand):
         # Pobieranie backendu
         backend = self._get_backend(context)
 
-        # Własna logika komendy
-        logger.info(f"Wykonuję własną komendę: {command_str}")
+        # Własna logika komendy - argumenty formatowane przez logging tylko, gdy rekord zostanie wypisany
+        logger.info("Wykonuję własną komendę: %s", command_str)
 
         # Symulacja wykonania (w prawdziwym przypadku użylibyśmy backendu)
         exit_code = 0
-        output = f"Wynik mojej komendy: {' '.join(self._args)}"
+        output = "Wynik mojej komendy: " + " ".join(self.args)
         error = ""
 
         # Tworzenie wyniku
@@ -161,50 +161,29 @@ def analiza_logów():
     """Demonstracja analizy zapisanych logów"""
     logger.info("=== Analiza zapisanych logów ===")
 
-    # Pobieranie historii
+    # Pobieranie statystyk - logger prowadzi je na bieżąco, bez przeglądania historii
     command_logger = CommandLoggerService.get_instance()
-    historia = command_logger.get_command_history()
+    statystyki = command_logger.get_stats_snapshot()
 
-    if not historia:
+    liczba_komend = statystyki["total"]
+    if not liczba_komend:
         print("Brak historii komend do analizy")
         return
 
-    # Statystyki
-    liczba_komend = len(historia)
-    udane_komendy = sum(
-        1 for entry in historia if entry.get("completed", False) and entry.get("result", {}).get("success", False)
-    )
-
+    udane_komendy = statystyki["successful"]
     błędne_komendy = liczba_komend - udane_komendy
 
-    # Średni czas wykonania
-    czasy = [entry.get("result", {}).get("execution_time", 0) for entry in historia if "result" in entry]
-    średni_czas = sum(czasy) / len(czasy) if czasy else 0
-
     # Wypisanie statystyk
     print("\nStatystyki wykonania komend:")
     print(f"Liczba wykonanych komend: {liczba_komend}")
     print(f"Udane komendy: {udane_komendy} ({(udane_komendy/liczba_komend*100):.1f}%)")
     print(f"Błędne komendy: {błędne_komendy} ({(błędne_komendy/liczba_komend*100):.1f}%)")
-    print(f"Średni czas wykonania: {średni_czas:.3f}s")
+    print(f"Średni czas wykonania: {statystyki['average_time']:.3f}s")
 
     # Najdłużej wykonujące się komendy
-    if czasy:
-        posortowane = sorted(
-            [
-                (
-                    entry.get("command", {}).get("command_name", ""),
-                    entry.get("result", {}).get("execution_time", 0),
-                )
-                for entry in historia
-                if "result" in entry
-            ],
-            key=lambda x: x[1],
-            reverse=True,
-        )
-
+    if statystyki["slowest"]:
         print("\nNajdłużej wykonujące się komendy:")
-        for nazwa, czas in posortowane[:3]:
+        for nazwa, czas in statystyki["slowest"]:
             print(f"  {nazwa}: {czas:.3f}s")
 
 
@@ -9,9 +9,11 @@ This example demonstrates:
 4. How to use version-specific parsers
 """
 
+import functools
 import os
 import re
 import sys
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 # Add the project root to the Python path
@@ -25,6 +27,26 @@ from src.mancer.domain.service.tool_version_service import ToolVersionService
 from src.mancer.infrastructure.command.base_command import BaseCommand
 from src.mancer.infrastructure.command.versioned_command_mixin import VersionedCommandMixin
 
+# Greeting patterns, compiled once for all parsers
+HELLO_PATTERN = re.compile(r"Hello, (.+)!")
+# English or Spanish greeting in one match - group 1 selects the entry in GREETING_VARIANTS
+GREETING_PATTERN = re.compile(r"(Hello|Hola), (.+)!")
+
+# Greeting -> (language, translation code, translation prefix)
+GREETING_VARIANTS = {
+    "Hello": ("English", "es", "Hola, "),
+    "Hola": ("Spanish", "en", "Hello, "),
+}
+
+# Translations added by version 3.x: (language code, greeting prefix)
+V3_TRANSLATIONS = (("fr", "Bonjour, "), ("de", "Hallo, "))
+
+
+@functools.lru_cache(maxsize=1)
+def _version_service() -> ToolVersionService:
+    """Returns the shared ToolVersionService, so its config and detected versions are loaded once"""
+    return ToolVersionService()
+
 
 class CustomGreetingCommand(BaseCommand, VersionedCommandMixin):
     """
@@ -71,7 +93,7 @@ class CustomGreetingCommand(BaseCommand, VersionedCommandMixin):
     def _parse_output(self, raw_output: str) -> Dict[str, Any]:
         """Default parser for greeting command output"""
         # Simple parsing of "Hello, {name}!"
-        match = re.match(r"Hello, (.+)!", raw_output)
+        match = HELLO_PATTERN.match(raw_output)
         if match:
             return {"greeting": "Hello", "name": match.group(1)}
         return {"raw": raw_output}
@@ -80,7 +102,7 @@ class CustomGreetingCommand(BaseCommand, VersionedCommandMixin):
         """
         Parser specific to version 1.x - simple English greeting
         """
-        match = re.match(r"Hello, (.+)!", raw_output)
+        match = HELLO_PATTERN.match(raw_output)
         if match:
             return {
                 "greeting": "Hello",
@@ -94,26 +116,17 @@ class CustomGreetingCommand(BaseCommand, VersionedCommandMixin):
         """
         Parser specific to version 2.x - adds Spanish greeting
         """
-        # First try English format
-        match = re.match(r"Hello, (.+)!", raw_output)
-        if match:
-            return {
-                "greeting": "Hello",
-                "name": match.group(1),
-                "language": "English",
-                "version": "2.x",
-                "translations": {"es": f"Hola, {match.group(1)}!"},
-            }
-
-        # Then try Spanish format
-        match = re.match(r"Hola, (.+)!", raw_output)
+        # English and Spanish formats are told apart by a single match
+        match = GREETING_PATTERN.match(raw_output)
         if match:
+            greeting, name = match.groups()
+            language, translation_code, translation_prefix = GREETING_VARIANTS[greeting]
             return {
-                "greeting": "Hola",
-                "name": match.group(1),
-                "language": "Spanish",
+                "greeting": greeting,
+                "name": name,
+                "language": language,
                 "version": "2.x",
-                "translations": {"en": f"Hello, {match.group(1)}!"},
+                "translations": {translation_code: translation_prefix + name + "!"},
             }
 
         return {"raw": raw_output, "version": "2.x"}
@@ -131,16 +144,11 @@ class CustomGreetingCommand(BaseCommand, VersionedCommandMixin):
         if "name" in result:
             name = result["name"]
             # Add French and German translations
-            if "translations" not in result:
-                result["translations"] = {}
-
-            result["translations"]["fr"] = f"Bonjour, {name}!"
-            result["translations"]["de"] = f"Hallo, {name}!"
+            translations = result.setdefault("translations", {})
+            translations.update({code: prefix + name + "!" for code, prefix in V3_TRANSLATIONS})
 
             # Add timestamp for v3 feature
-            import datetime
-
-            result["timestamp"] = datetime.datetime.now().isoformat()
+            result["timestamp"] = datetime.now().isoformat()
 
         return result
 
@@ -160,7 +168,7 @@ class CustomGreetingCommand(BaseCommand, VersionedCommandMixin):
 
 def register_custom_tool_versions():
     """Register custom tool versions for demonstration"""
-    version_service = ToolVersionService()
+    version_service = _version_service()
 
     # Register some allowed versions for our custom tool
     version_service.register_allowed_version("greeting_tool", "1.0.0")
@@ -180,37 +188,38 @@ def demonstrate_version_adaptation():
 
     # Register a method to simulate version detection
     # In a real command, this would be detected from the system
-    version_service = ToolVersionService()
+    version_service = _version_service()
 
     print("\n=== Testing custom command with different versions ===")
 
-    # Test with different versions
-    for version_str in ["1.0.0", "2.1.0", "3.0.5"]:
-        print(f"\nTesting with version {version_str}:")
+    # Version objects are created up front; the mocked detection returns the one under test
+    versions = {version_str: ToolVersion("greeting_tool", version_str) for version_str in ["1.0.0", "2.1.0", "3.0.5"]}
+    detected = {}
 
-        # Create a version object
-        version = ToolVersion("greeting_tool", version_str)
+    # Mock version detection
+    version_service.detect_tool_version = detected.get
 
-        # Mock version detection
-        version_service.detect_tool_version = lambda tool_name: (version if tool_name == "greeting_tool" else None)
+    # Create context - the same for every version, execute() only reads the name parameter
+    context = CommandContext()
+    context.add_parameter("name", "Mancer User")
 
-        # Create context
-        context = CommandContext()
-        context.add_parameter("name", "Mancer User")
+    # Test with different versions
+    for version_str, version in versions.items():
+        print(f"\nTesting with version {version_str}:")
+        detected["greeting_tool"] = version
 
         # Execute command
         result = greeting_command.execute(context)
 
-        # Print the result
-        print(f"Command output: {result.raw_output}")
-        print("Structured output:")
+        # Print the result - the report is collected first and written with a single print
+        lines = [f"Command output: {result.raw_output}", "Structured output:"]
         for key, value in result.structured_output.items():
             if key == "translations":
-                print(f"  {key}:")
-                for lang, trans in value.items():
-                    print(f"    {lang}: {trans}")
+                lines.append(f"  {key}:")
+                lines += [f"    {lang}: {trans}" for lang, trans in value.items()]
             else:
-                print(f"  {key}: {value}")
+                lines.append(f"  {key}: {value}")
+        print("\n".join(lines))
 
 
 def main():
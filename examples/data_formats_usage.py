@@ -7,7 +7,9 @@ This example demonstrates:
 3. Chaining commands with structural data processing
 """
 
+import json
 import os
+import shlex
 import sys
 
 import polars as pl
@@ -36,6 +38,18 @@ def display_history_summary(result):
         print(f"Command type: {last_step.command_type}")
 
 
+def top_users(ps_result, count_column, n=5):
+    """Counts processes per user and keeps the n busiest users in one lazy Polars query"""
+    return ps_result.transform(
+        lambda df: df.lazy()
+        .group_by("USER")
+        .agg(pl.len().alias(count_column))
+        .top_k(n, by=count_column)
+        .sort(count_column, descending=True)
+        .collect()
+    )
+
+
 def main():
     # Initialize context
     context = CommandContext()
@@ -47,6 +61,8 @@ def main():
     # POLARS format (default)
     print("POLARS Format (default):")
     ls_command = LsCommand().with_option("-la")
+    # `ls -la` is executed once; later examples transform this result, and every
+    # transformation returns a new CommandResult, so the listing is never modified
     result_polars = ls_command.execute(context)
     print(f"Data type: {type(result_polars.structured_output)}")
     print(f"Data format: {result_polars.data_format}")
@@ -94,7 +110,7 @@ def main():
     print_separator()
 
     print("Transform CommandResult directly:")
-    result = LsCommand().with_option("-la").execute(context)
+    result = result_polars
 
     # Transform the result directly
     filtered = (result
@@ -117,10 +133,7 @@ def main():
     ps_result = PsCommand().execute(context)
 
     # Group by user and count processes
-    user_stats = (ps_result
-                  .group_by("USER", pl.len().alias("process_count"))
-                  .sort("process_count", descending=True)
-                  .head(5))
+    user_stats = top_users(ps_result, "process_count")
 
     print("Top users by process count:")
     print(user_stats.structured_output)
@@ -152,57 +165,65 @@ def main():
     print_separator()
 
     print("Data analysis using fluent methods:")
-    ps_result = PsCommand().execute(context)
+    # The process list from the first Example 4 is reused instead of running ps again
 
     print("Process count by user (using fluent methods):")
-    user_counts = (ps_result
-                   .group_by("USER", pl.len().alias("count"))
-                   .sort("count", descending=True)
-                   .head(5))
+    user_counts = top_users(ps_result, "count")
     print(user_counts.structured_output)
 
     print("\nMemory usage statistics (using fluent methods):")
-    if "RSS" in ps_result.as_polars().columns:
-        rss_stats = (ps_result
-                     .select([pl.col("RSS").min().alias("min_rss"),
-                              pl.col("RSS").max().alias("max_rss"),
-                              pl.col("RSS").mean().alias("avg_rss"),
-                              pl.col("RSS").median().alias("median_rss")]))
-        print(rss_stats.structured_output)
+    ps_df = ps_result.as_polars()
+    if "RSS" in ps_df.columns:
+        # Aggregates computed straight on the DataFrame - no intermediate CommandResult to render
+        rss_stats = ps_df.select([pl.col("RSS").min().alias("min_rss"),
+                                  pl.col("RSS").max().alias("max_rss"),
+                                  pl.col("RSS").mean().alias("avg_rss"),
+                                  pl.col("RSS").median().alias("median_rss")])
+        print(rss_stats)
 
     print_separator()
     print("=== Example 6: Advanced Filtering Language ===")
     print_separator()
 
     print("Safe mathematical operations and advanced filtering:")
-    ls_result = LsCommand().with_option("-la").execute(context)
+    # Both queries below start from the same listing - they are planned lazily
+    # and collected together, so Polars executes them in one pass
+    ls_lazy = result_polars.as_polars().lazy()
 
     # Safe mathematical operations
-    result = (ls_result
-              .safe_add_columns("size", "size", "double_size")  # size * 2
-              .safe_divide_columns("double_size", "size", "ratio")  # Should be 2.0
-              .filter_numeric_range("size", 1000, 10000)  # Files 1KB-10KB
-              .filter_string_pattern("filename", r"\.(txt|md)$", case_insensitive=True)  # Text files
-              .head(3))
+    size = pl.col("size").cast(pl.Float64, strict=False)
+    text_files_plan = (ls_lazy
+                       .with_columns((size + size).alias("double_size"))  # size * 2
+                       .with_columns(pl.when(size != 0)
+                                     .then(pl.col("double_size") / size)
+                                     .otherwise(None)
+                                     .alias("ratio"))  # Should be 2.0
+                       .filter(size.is_between(1000, 10000))  # Files 1KB-10KB
+                       .filter(pl.col("filename").str.contains(r"(?i)\.(txt|md)$"))  # Text files
+                       .head(3))
+
+    # Matrix operations
+    matrix_plan = (ls_lazy
+                   .slice(0, 10)
+                   .gather_every(2)  # Every other row
+                   .select(["filename", "size"])  # Select columns
+                   .head(3))
+
+    text_files, matrix = pl.collect_all([text_files_plan, matrix_plan])
 
     print("Filtered text files (1KB-10KB):")
-    print(result.structured_output)
+    print(text_files)
 
     print("\nMatrix operations:")
-    matrix_result = (ls_result
-                     .slice_rows(0, 10, 2)  # Every other row
-                     .slice_columns(["filename", "size"])  # Select columns
-                     .head(3))
-
     print("Matrix slice result:")
-    print(matrix_result.structured_output)
+    print(matrix)
 
     print_separator()
     print("=== Example 7: Data Extraction and Inspection ===")
     print_separator()
 
     print("Data inspection methods:")
-    result = LsCommand().with_option("-la").execute(context)
+    result = result_polars
 
     print(f"DataFrame shape: {result.get_shape()}")
     print(f"Column names: {result.get_headers()}")
@@ -221,13 +242,14 @@ def main():
     # Create sample data with duplicates and nulls
     from mancer.infrastructure.command.custom.custom_command import CustomCommand
 
-    # Simulate data with issues
-    data_cmd = CustomCommand("echo").add_arg("'[")
-    data_cmd = data_cmd.add_arg('{"name": "Alice", "age": 25},')
-    data_cmd = data_cmd.add_arg('{"name": "Bob", "age": 30},')
-    data_cmd = data_cmd.add_arg('{"name": "Alice", "age": 25},')  # duplicate
-    data_cmd = data_cmd.add_arg('{"name": "Charlie", "age": null}')  # null
-    data_cmd = data_cmd.add_arg("]'")
+    # Simulate data with issues - the whole JSON payload is passed as one quoted argument
+    records = [
+        {"name": "Alice", "age": 25},
+        {"name": "Bob", "age": 30},
+        {"name": "Alice", "age": 25},  # duplicate
+        {"name": "Charlie", "age": None},  # null
+    ]
+    data_cmd = CustomCommand("echo").add_arg(shlex.quote(json.dumps(records)))
 
     try:
         data_result = data_cmd.execute(context)
@@ -251,7 +273,7 @@ def main():
     print_separator()
 
     print("Statistical operations:")
-    ls_result = LsCommand().with_option("-la").execute(context)
+    ls_result = result_polars
 
     # Add some numeric data for demo
     with_numbers = ls_result.add_columns("size", "size", "double_size")
@@ -273,20 +295,21 @@ def main():
     print_separator()
 
     print("String manipulation:")
-    ls_result = LsCommand().with_option("-la").execute(context)
+    # Only the first 3 rows are shown, so the string operations run on those rows only
+    ls_preview = result_polars.head(3)
 
     print("Original filenames:")
-    print(ls_result.structured_output["filename"].head(3))
+    print(ls_preview.structured_output["filename"])
 
     # Convert to uppercase
-    upper = ls_result.str_upper("filename")
+    upper = ls_preview.str_upper("filename")
     print("Uppercase:")
-    print(upper.structured_output["filename"].head(3))
+    print(upper.structured_output["filename"])
 
     # Check for patterns
-    pattern_check = ls_result.str_contains("filename", ".txt", "is_text")
+    pattern_check = ls_preview.str_contains("filename", ".txt", "is_text")
     print("Text file check:")
-    print(pattern_check.structured_output[["filename", "is_text"]].head(3))
+    print(pattern_check.structured_output[["filename", "is_text"]])
 
     # Display history summary
     print("\nAnalysis history summary:")
@@ -9,6 +9,7 @@ This example demonstrates:
 4. How to handle version warnings
 """
 
+import functools
 import os
 import sys
 
@@ -20,6 +21,12 @@ from src.mancer.domain.service.tool_version_service import ToolVersionService
 from src.mancer.infrastructure.command.system.df_command import DfCommand
 
 
+@functools.lru_cache(maxsize=1)
+def _version_service() -> ToolVersionService:
+    """Shared version service - the df version is detected once and reused by every demonstration"""
+    return ToolVersionService()
+
+
 def demonstrate_basic_usage():
     """Demonstrate basic usage of the df command"""
     print("\n=== Basic df command usage ===")
@@ -62,7 +69,7 @@ def demonstrate_version_detection():
     context = CommandContext()
 
     # Get tool version service
-    version_service = ToolVersionService()
+    version_service = _version_service()
 
     # Detect df version
     df_version = version_service.detect_tool_version("df")
@@ -116,7 +123,7 @@ def demonstrate_registering_versions():
     print("\n=== Registering allowed versions for df ===")
 
     # Get tool version service
-    version_service = ToolVersionService()
+    version_service = _version_service()
 
     # Current df version
     current_version = version_service.detect_tool_version("df")
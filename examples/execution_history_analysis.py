@@ -11,6 +11,9 @@ import json
 import os
 import sys
 import time
+from collections import Counter
+
+import numpy as np
 
 # Add mancer module path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -36,26 +39,24 @@ def analyze_execution_history(history):
 
     # General information
     total_steps = history.get_steps_count()
-    successful_steps = sum(1 for step in history if step.success)
+    successful_steps = sum(1 for step in history.steps if step.success)
 
     print(f"Number of steps: {total_steps}")
     print(f"Successful steps: {successful_steps}/{total_steps} ({successful_steps/total_steps*100:.1f}%)")
 
     # Time analysis
     if total_steps > 1:
-        start_time = history.steps[0].timestamp
-        end_time = history.steps[-1].timestamp
-        total_execution_time = (end_time - start_time).total_seconds()
+        timestamps = np.fromiter((step.timestamp.timestamp() for step in history.steps), np.float64, total_steps)
+        total_execution_time = timestamps[-1] - timestamps[0]
         print(f"Total execution time: {total_execution_time:.3f} seconds")
 
         # Analysis of individual step times
         print("\nExecution time of individual steps:")
-        for i in range(1, total_steps):
-            step_time = (history.steps[i].timestamp - history.steps[i - 1].timestamp).total_seconds()
+        for i, step_time in enumerate(np.diff(timestamps), start=1):
             print(f"  Step {i} -> {i+1}: {step_time:.3f}s")
 
     # Problem analysis
-    failed_steps = [i for i, step in enumerate(history) if not step.success]
+    failed_steps = [i for i, step in enumerate(history.steps) if not step.success]
     if failed_steps:
         print("\nProblematic steps:")
         for i in failed_steps:
@@ -67,10 +68,7 @@ def analyze_execution_history(history):
 
     # Data format analysis
     print("\nData format usage:")
-    format_counts = {}
-    for step in history:
-        format_name = DataFormat.to_string(step.data_format)
-        format_counts[format_name] = format_counts.get(format_name, 0) + 1
+    format_counts = Counter(DataFormat.to_string(step.data_format) for step in history.steps)
 
     for format_name, count in format_counts.items():
         print(f"  {format_name}: {count} steps ({count/total_steps*100:.1f}%)")
@@ -97,8 +97,8 @@ def detect_tool_versions():
     tools = ["ls", "grep", "cat", "ps", "df", "find", "wc", "systemctl"]
 
     print("\n=== Detected Tool Versions ===")
-    for tool in tools:
-        tool_version = service.detect_tool_version(tool)
+    # All probes run concurrently - results keep the order of the list
+    for tool, tool_version in service.detect_tool_versions(tools).items():
         if tool_version:
             print(f"{tool:12} --> {tool_version.version}")
         else:
@@ -4,6 +4,7 @@ Mancer Terminal - Skrypt uruchamiający (Python)
 Uruchamia Mancer Terminal w środowisku wirtualnym z deweloperskim Mancerem
 """
 
+import functools
 import os
 import subprocess
 import sys
@@ -99,6 +100,12 @@ def create_venv() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _in_venv() -> bool:
+    """Sprawdza czy proces działa w środowisku wirtualnym (stałe w czasie życia procesu)"""
+    return sys.prefix != getattr(sys, "base_prefix", sys.prefix) or "VIRTUAL_ENV" in os.environ
+
+
 def activate_venv() -> bool:
     """Aktywuje środowisko wirtualne"""
     try:
@@ -108,9 +115,7 @@ def activate_venv() -> bool:
             return False
 
         # Sprawdź czy jesteśmy w venv
-        if hasattr(sys, "real_prefix") or (
-            hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
-        ):
+        if _in_venv():
             print_success("Środowisko wirtualne jest już aktywne")
             return True
 
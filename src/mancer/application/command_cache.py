@@ -32,6 +32,10 @@ class CommandCache:
         self._refresh_thread: Optional[threading.Thread] = None
         self._stop_refresh = threading.Event()
         self._lock = threading.RLock()
+        # Liczniki odczytów: trafienia, chybienia i trafienia bez metadanych
+        self._hits = 0
+        self._misses = 0
+        self._empty_metadata_hits = 0
 
         # Jeśli włączono auto-refresh, uruchom wątek odświeżający
         if self._auto_refresh:
@@ -103,9 +107,37 @@ class CommandCache:
             Wynik komendy lub None, jeśli nie znaleziono
         """
         with self._lock:
-            if command_id in self._cache:
-                return self._cache[command_id][0]
-            return None
+            entry = self._cache.get(command_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            if not entry[0].metadata:
+                self._empty_metadata_hits += 1
+            return entry[0]
+
+    def get_many(self, command_ids: List[str]) -> Dict[str, CommandResult]:
+        """
+        Pobiera wyniki wielu komend z cache w jednym wywołaniu (jedno zajęcie blokady).
+
+        Args:
+            command_ids: Identyfikatory komend
+
+        Returns:
+            Słownik command_id -> wynik, tylko dla znalezionych komend
+        """
+        found: Dict[str, CommandResult] = {}
+        with self._lock:
+            for command_id in command_ids:
+                entry = self._cache.get(command_id)
+                if entry is None:
+                    self._misses += 1
+                    continue
+                self._hits += 1
+                if not entry[0].metadata:
+                    self._empty_metadata_hits += 1
+                found[command_id] = entry[0]
+        return found
 
     def get_with_metadata(self, command_id: str) -> Optional[Tuple[CommandResult, datetime, Dict[str, Any]]]:
         """
@@ -145,6 +177,7 @@ class CommandCache:
         with self._lock:
             self._cache.clear()
             self._history.clear()
+            self._hits = self._misses = self._empty_metadata_hits = 0
 
     def set_auto_refresh(self, enabled: bool, interval: Optional[int] = None) -> None:
         """
@@ -176,6 +209,7 @@ class CommandCache:
         """
         with self._lock:
             success_count = sum(1 for _, _, success in self._history if success)
+            lookups = self._hits + self._misses
             return {
                 "total_commands": len(self._history),
                 "success_count": success_count,
@@ -184,6 +218,10 @@ class CommandCache:
                 "max_size": self._max_size,
                 "auto_refresh": self._auto_refresh,
                 "refresh_interval": self._refresh_interval,
+                "hits": self._hits,
+                "misses": self._misses,
+                "empty_metadata_hits": self._empty_metadata_hits,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
             }
 
     def export_data(self, include_results: bool = True) -> Dict[str, Any]:
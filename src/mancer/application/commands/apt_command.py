@@ -1,8 +1,15 @@
+import hashlib
 import json
 import os
+import tempfile
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
+from ...domain.model.command_context import CommandContext
+from ...domain.model.command_result import CommandResult
+from ...infrastructure.backend.bash_backend import BashBackend
 from .base_command import BaseCommand
 
 
@@ -12,6 +19,36 @@ class AptCommand(BaseCommand):
     # Plik do przechowywania stanu apt
     APT_STATE_FILE = os.path.expanduser("~/.mancer/apt_state.json")
 
+    # Plik z zapamiętanymi wynikami zapytań o stan apt (cache dyskowy z TTL) - w katalogu cache XDG,
+    # bo w przeciwieństwie do stanu apt można go w każdej chwili usunąć
+    PROBE_CACHE_FILE = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "mancer", "apt_probe_cache.json"
+    )
+    # Czas ważności zapamiętanego wyniku w sekundach
+    PROBE_CACHE_TTL = 120
+    # Komendy tylko do odczytu, których wynik zmienia się rzadko
+    CACHEABLE_COMMANDS = frozenset(
+        {
+            "get-last-update",
+            "needs-update",
+            "updates-count",
+            "repo-status",
+            "is-installed-bool",
+            "package-version",
+            "list",
+        }
+    )
+    # Pliki, których zmiana (apt update, instalacja/usunięcie pakietu, dodanie/usunięcie repozytorium)
+    # unieważnia zapamiętane wyniki
+    PROBE_INVALIDATION_PATHS = (
+        "/var/lib/apt/lists",
+        "/var/lib/dpkg/status",
+        "/etc/apt/sources.list",
+        "/etc/apt/sources.list.d",
+    )
+
+    _probe_cache_lock = threading.Lock()
+
     def __init__(self):
         super().__init__(command_name="apt")
         self._ensure_state_dir()
@@ -67,6 +104,101 @@ class AptCommand(BaseCommand):
         }
         self._save_state()
 
+    def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
+        """
+        Wykonuje komendę, a wyniki zapytań o stan apt bierze z cache dyskowego, jeśli są aktualne.
+
+        Wynik zapytania jest ważny przez PROBE_CACHE_TTL sekund i tylko dopóki nie zmienią się
+        listy pakietów apt, baza dpkg ani plik stanu frameworka.
+
+        Args:
+            context: Kontekst wykonania komendy
+            input_result: Opcjonalny wynik poprzedniej komendy (dla potoków)
+
+        Returns:
+            CommandResult: Wynik wykonania komendy
+        """
+        if not self._is_cacheable_probe(context, input_result):
+            return super().execute(context, input_result)
+
+        command_str = self.build_command()
+        key = self._probe_cache_key(command_str)
+        token = self._probe_cache_token()
+
+        cached = self._load_probe_cache().get(key)
+        if cached and cached.get("token") == token and time.time() - cached.get("time", 0) < self.PROBE_CACHE_TTL:
+            context.add_to_history(command_str)
+            return BashBackend().parse_output(
+                command_str, cached["raw_output"], cached["exit_code"], cached.get("error_output", "")
+            )
+
+        result = super().execute(context, input_result)
+        if result.success:
+            self._store_probe_result(key, token, result)
+        return result
+
+    def _is_cacheable_probe(self, context: CommandContext, input_result: Optional[CommandResult]) -> bool:
+        """Sprawdza czy wynik komendy może zostać wzięty z cache dyskowego"""
+        return (
+            self._params.get("command") in self.CACHEABLE_COMMANDS
+            and input_result is None
+            and not context.is_remote()
+            and not context.parameters.get("live_output", False)
+        )
+
+    def _probe_cache_key(self, command_str: str) -> str:
+        """Zwraca klucz cache: skrót komendy i UID użytkownika (komenda może zawierać hasło sudo)"""
+        return hashlib.sha1(f"{command_str}\0{os.getuid()}".encode()).hexdigest()
+
+    def _probe_cache_token(self) -> List[float]:
+        """Zwraca czasy modyfikacji plików, od których zależą wyniki zapytań o stan apt"""
+        token = []
+        for path in (*self.PROBE_INVALIDATION_PATHS, self.APT_STATE_FILE):
+            try:
+                token.append(os.stat(path).st_mtime)
+            except OSError:
+                token.append(0.0)
+        return token
+
+    def _load_probe_cache(self) -> Dict[str, Any]:
+        """Ładuje zapamiętane wyniki zapytań z pliku"""
+        try:
+            with open(self.PROBE_CACHE_FILE, "r") as f:
+                return cast(Dict[str, Any], json.load(f))
+        except (OSError, ValueError):
+            return {}
+
+    def _store_probe_result(self, key: str, token: List[float], result: CommandResult) -> None:
+        """Zapisuje wynik zapytania w pliku cache, pomijając wpisy, które już wygasły"""
+        now = time.time()
+        with self._probe_cache_lock:
+            entries = {
+                k: v for k, v in self._load_probe_cache().items() if now - v.get("time", 0) < self.PROBE_CACHE_TTL
+            }
+            entries[key] = {
+                "time": now,
+                "token": token,
+                "exit_code": result.exit_code,
+                "raw_output": result.raw_output,
+                "error_output": result.error_message or "",
+            }
+            cache_dir = os.path.dirname(self.PROBE_CACHE_FILE)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                # Zapis atomowy - równoległe odczyty nie zobaczą niepełnego pliku
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            except OSError:
+                return  # Ignorujemy błędy zapisu - cache jest tylko optymalizacją
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.PROBE_CACHE_FILE)
+            except (OSError, TypeError, ValueError):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
     def with_sudo(self, password: Optional[str] = None) -> "AptCommand":
         """
         Dodaje sudo do komendy.
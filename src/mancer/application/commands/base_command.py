@@ -1,3 +1,4 @@
+import copy
 import pathlib
 from typing import Any, Dict, List, Optional, TypeVar, Union, cast
 
@@ -178,14 +179,21 @@ class BaseCommand(CommandInterface[T]):
         Returns:
             Nowa instancja komendy z tą samą konfiguracją
         """
-        # Tworzymy nową instancję tej samej klasy
-        new_command = self.__class__(self._command_name)
+        return cast(T, copy.copy(self))
 
-        # Kopiujemy parametry i opcje
+    def __copy__(self) -> "BaseCommand":
+        """
+        Płytka kopia komendy bez ponownego wywoływania __init__.
+
+        Podklasy (np. AptCommand) mają konstruktory bez argumentów i wykonujące pracę
+        (odczyt pliku stanu), więc kopia powstaje przez object.__new__. Parametry i opcje
+        są kopiowane, bo metody buildera modyfikują je w miejscu.
+        """
+        new_command = object.__new__(self.__class__)
+        new_command.__dict__.update(self.__dict__)
         new_command._params = self._params.copy()
         new_command._options = self._options.copy()
-
-        return cast(T, new_command)
+        return new_command
 
     def __str__(self) -> str:
         """Zwraca reprezentację tekstową komendy"""
@@ -1,12 +1,20 @@
 import hashlib
-from typing import Any, Dict, List, Optional
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..domain.interface.command_interface import CommandInterface
 from ..domain.model.command_context import CommandContext, ExecutionMode
 from ..domain.model.command_result import CommandResult
+from ..domain.model.execution_step import ExecutionStep
 from ..domain.service.command_chain_service import CommandChain
-from ..infrastructure.backend.bash_backend import BashBackend
+from ..infrastructure.backend.bash_backend import BashBackend, spawn_kwargs
+from ..infrastructure.backend.bash_session_backend import BashSessionBackend
 from ..infrastructure.backend.ssh_backend import SshBackendFactory
+from ..infrastructure.command.base_command import BaseCommand
 from ..infrastructure.factory.command_factory import CommandFactory
 from ..infrastructure.logging.mancer_logger import MancerLogger
 from .command_cache import CommandCache
@@ -119,6 +127,7 @@ class ShellRunner:
         self._command_cache = CommandCache(max_size=cache_size)
         self._cache_enabled = enable_cache
         self.enable_live_output = enable_live_output
+        self._bash_session: Optional[BashSessionBackend] = None
 
         # Initialize command logging subsystem
         if enable_command_logging:
@@ -160,13 +169,16 @@ class ShellRunner:
         # Determine if we're using live output
         use_live_output = live_output or self.enable_live_output
 
+        # Command string is built once per command instance and reused as the cache key
+        command_key = self._command_key(command)
+
         # For commands with 'refresh' in their name, always enable live output
-        if "refresh" in str(command).lower():
+        if "refresh" in command_key.lower():
             use_live_output = True
 
         # Generate a unique command identifier if not provided
         if self._cache_enabled and cache_id is None and not use_live_output:
-            cache_id = self._generate_command_id(command, context)
+            cache_id = self._generate_command_id(command, context, command_key)
 
             # Check if the result is in the cache
             cached_result = self._command_cache.get(cache_id)
@@ -180,7 +192,10 @@ class ShellRunner:
 
         # Execute the command - use __call__ method which provides logging
         if isinstance(command, CommandChain):
-            result = command.execute(context)
+            if not use_live_output and self._is_os_pipeline(command, context):
+                result = self._execute_os_pipeline(command, context)
+            else:
+                result = command.execute(context)
         else:
             # Use __call__ instead of direct execute to ensure logging
             result = command(context) if hasattr(command, "__call__") else command.execute(context)
@@ -195,7 +210,7 @@ class ShellRunner:
                 command_type = command.name
 
             # Get the full command string
-            command_string = command.build_command() if hasattr(command, "build_command") else str(command)
+            command_string = command_key
 
             metadata = {
                 "context": {
@@ -236,14 +251,21 @@ class ShellRunner:
 
     def _create_default_context(self) -> CommandContext:
         """Creates a default execution context"""
-        import os
-
         return CommandContext(current_directory=os.getcwd())
 
-    def _generate_command_id(self, command: CommandInterface, context: CommandContext) -> str:
+    @staticmethod
+    def _command_key(command: CommandInterface) -> str:
+        """Returns the command string, memoized on the command when it supports it"""
+        if isinstance(command, BaseCommand):
+            return command.cache_key()
+        return command.build_command() if hasattr(command, "build_command") else str(command)
+
+    def _generate_command_id(
+        self, command: CommandInterface, context: CommandContext, command_key: Optional[str] = None
+    ) -> str:
         """Generates a unique identifier for a command in a specific context"""
         # Get command string
-        cmd_str = command.build_command() if hasattr(command, "build_command") else str(command)
+        cmd_str = command_key if command_key is not None else self._command_key(command)
 
         # Create a string containing all the contextual information
         context_str = f"{context.current_directory}|{context.execution_mode}|"
@@ -252,10 +274,142 @@ class ShellRunner:
         if context.remote_host:
             context_str += f"{context.remote_host.host}|{context.remote_host.user}|{context.remote_host.port}"
 
+        # Komendy z create_bash_command(discard_*) dają inne wyjście niż ta sama komenda bez przekierowań
+        backend = getattr(command, "backend", None)
+        discard_stdout = getattr(backend, "discard_stdout", False)
+        discard_stderr = getattr(backend, "discard_stderr", False)
+        if discard_stdout or discard_stderr:
+            context_str += f"|discard:{int(discard_stdout)}{int(discard_stderr)}"
+
         # Combine and hash
         combined = f"{cmd_str}|{context_str}"
         return hashlib.md5(combined.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _is_os_pipeline(chain: CommandChain, context: CommandContext) -> bool:
+        """Checks whether a chain can run as a single OS-level pipeline.
+
+        Only local chains made purely of pipe steps between plain bash-backed
+        commands qualify - DataFrame transforms, sequential steps, sudo and
+        custom backends still go through CommandChain.execute().
+        """
+        if context.execution_mode != ExecutionMode.LOCAL or len(chain.commands) < 2:
+            return False
+        if not all(chain.is_pipeline[1:]):
+            return False
+        return all(
+            command is not None
+            and type(getattr(command, "backend", None)) is BashBackend
+            and hasattr(command, "_prepare_result")
+            and not getattr(command, "requires_sudo", False)
+            for command in chain.commands
+        )
+
+    @staticmethod
+    def _run_pipe(commands: List[str], context: CommandContext) -> Tuple[int, str, str]:
+        """Runs shell commands connected stdout -> stdin by kernel pipes.
+
+        Intermediate output never passes through Python; only the last stage's
+        stdout is read. Returns (exit_code, stdout, stderr) with the exit code of
+        the last stage, as in a plain shell pipeline.
+        """
+        env = {**os.environ, **context.environment_variables} if context.environment_variables else None
+        processes: List[subprocess.Popen] = []
+        prev_stdout = None
+
+        # Wspólny plik na stderr - osobne potoki stderr mogłyby zablokować etapy pośrednie
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            try:
+                for command_str in commands:
+                    process = subprocess.Popen(
+                        command_str,
+                        shell=True,
+                        text=True,
+                        stdin=prev_stdout,
+                        stdout=subprocess.PIPE,
+                        stderr=stderr_file,
+                        env=env,
+                        # Etapy potoku startują przy każdym wykonaniu - szybka ścieżka posix_spawn
+                        **spawn_kwargs(context.current_directory, inherit_fds=True),
+                    )
+                    if prev_stdout is not None:
+                        # Koniec do odczytu trzyma tylko następny etap - producent dostanie SIGPIPE
+                        prev_stdout.close()
+                    prev_stdout = process.stdout
+                    processes.append(process)
+            except OSError as e:
+                # Etap nie wystartował (np. brak katalogu roboczego) - sprzątnij już uruchomione
+                if prev_stdout is not None:
+                    prev_stdout.close()
+                for process in processes:
+                    process.kill()
+                    process.wait()
+                return -1, "", str(e)
+
+            output, _ = processes[-1].communicate()
+            for process in processes[:-1]:
+                process.wait()
+
+            stderr_file.seek(0)
+            error = stderr_file.read()
+
+        return processes[-1].returncode, output or "", error
+
+    def _execute_os_pipeline(self, chain: CommandChain, context: CommandContext) -> CommandResult:
+        """Executes a pure pipe chain via _run_pipe and parses the output with its last command.
+
+        Logging, context history and result metadata (execution_history,
+        command_chain) match what CommandChain.execute() produces; every stage
+        reports the pipeline's result, as a shell pipeline does.
+        """
+        chain_commands: List[Any] = [command for command in chain.commands if command is not None]
+        commands = [command.build_command() for command in chain_commands]
+
+        chain._log_chain_structure()
+        log_infos = [
+            (command, command._log_command_start(command_str, context))
+            for command, command_str in zip(chain_commands, commands)
+            if hasattr(command, "_log_command_start")
+        ]
+
+        exit_code, output, error = self._run_pipe(commands, context)
+
+        success = exit_code == 0
+        last_command = chain_commands[-1]
+        result: CommandResult = last_command._prepare_result(
+            raw_output=output,
+            success=success,
+            exit_code=exit_code,
+            error_message=error if error and not success else None,
+        )
+
+        for command, command_info in log_infos:
+            command._log_command_end(command_info, result)
+
+        if success:
+            for command, command_str in zip(chain_commands[:-1], commands[:-1]):
+                context.add_to_history(command_str)
+                chain.history.add_step(
+                    ExecutionStep(
+                        command_string=command_str,
+                        command_type=command.__class__.__name__,
+                        data_format=command.preferred_data_format,
+                    )
+                )
+            context.add_to_history(commands[-1])
+            for step in result.get_history().iter_steps():
+                chain.history.add_step(step)
+
+        if result.metadata is None:
+            result.metadata = {}
+        result.metadata["execution_history"] = chain.history.model_dump()
+        result.metadata["command_chain"] = {
+            "commands": commands,
+            "pipeline_steps": chain.is_pipeline,
+            "total_commands": len(commands),
+        }
+        return result
+
     def set_remote_execution(
         self,
         host: str,
@@ -395,6 +549,10 @@ class ShellRunner:
             "max_size": 0,
             "auto_refresh": False,
             "refresh_interval": 0,
+            "hits": 0,
+            "misses": 0,
+            "empty_metadata_hits": 0,
+            "hit_ratio": 0.0,
         }
 
     def get_command_history(self, limit: Optional[int] = None, success_only: bool = False) -> List[Any]:
@@ -412,6 +570,24 @@ class ShellRunner:
         logger = MancerLogger.get_instance()
         return logger.get_command_history(limit=limit, success_only=success_only)
 
+    def get_cache_history(
+        self, limit: Optional[int] = None, success_only: bool = False
+    ) -> List[Tuple[str, datetime, bool]]:
+        """
+        Gets the history of commands stored in the result cache.
+
+        Args:
+            limit: Maximum number of history entries to return
+            success_only: Whether to only return successful commands
+
+        Returns:
+            List of (command_id, timestamp, success) tuples; command_id works with get_cached_result()
+        """
+        if not self._cache_enabled:
+            return []
+
+        return self._command_cache.get_history(limit=limit, success_only=success_only)
+
     def get_cached_result(self, command_id: str) -> Optional[CommandResult]:
         """
         Gets a cached command result by ID.
@@ -427,6 +603,21 @@ class ShellRunner:
 
         return self._command_cache.get(command_id)
 
+    def get_cached_results(self, command_ids: List[str]) -> Dict[str, CommandResult]:
+        """
+        Gets several cached command results in one call.
+
+        Args:
+            command_ids: Cache IDs of the commands
+
+        Returns:
+            Mapping of command ID to cached result; IDs not in the cache are omitted
+        """
+        if not self._cache_enabled:
+            return {}
+
+        return self._command_cache.get_many(command_ids)
+
     def export_cache_data(self, include_results: bool = True) -> Dict[str, Any]:
         """
         Exports the command cache data.
@@ -454,11 +645,16 @@ class ShellRunner:
         """
         return self.execute(command, context_params, live_output=True)
 
-    def create_bash_command(self, command_str: str) -> CommandInterface:
+    def create_bash_command(
+        self, command_str: str, discard_stdout: bool = False, discard_stderr: bool = False
+    ) -> CommandInterface:
         """Create a raw bash command wrapper based on EchoCommand.
 
         Args:
             command_str: Bash command string to execute as-is.
+            discard_stdout: Send stdout to /dev/null instead of capturing it
+                (for probes that only need the exit code).
+            discard_stderr: Send stderr to /dev/null instead of capturing it.
 
         Returns:
             CommandInterface: A command object whose build_command() returns command_str.
@@ -476,8 +672,56 @@ class ShellRunner:
 
         echo.build_command = _build_command  # type: ignore
 
+        # Surowe komendy bash trafiają do jednej, długo żyjącej sesji bash zamiast nowego procesu
+        if self._bash_session is None:
+            self._bash_session = BashSessionBackend()
+        echo.backend = self._bash_session
+        if discard_stdout or discard_stderr:
+            echo.backend = self._bash_session.discarding(stdout=discard_stdout, stderr=discard_stderr)
+
         return echo
 
+    def execute_batch(
+        self,
+        commands: List[CommandInterface],
+        context_params: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[CommandResult]:
+        """Execute independent commands concurrently.
+
+        All child processes are started up front and reaped as they finish, so the
+        batch takes roughly as long as its slowest command. Results keep the order
+        of ``commands``; caching and logging behave as in execute(). Commands from
+        create_bash_command() share one bash session and still run one at a time.
+
+        Args:
+            commands: Commands (or chains) with no data dependencies between them.
+            context_params: Additional context parameters applied to every command.
+            max_workers: Maximum number of commands running at once (default: all).
+
+        Returns:
+            List of CommandResult, one per command, in input order.
+        """
+        if not commands:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or len(commands)) as executor:
+            return list(executor.map(lambda command: self.execute(command, context_params), commands))
+
+    def execute_script(self, script: str, context_params: Optional[Dict[str, Any]] = None) -> CommandResult:
+        """Execute a multi-statement bash script in a single subprocess.
+
+        Batching several short probes into one script (e.g. joined with ``;`` and
+        separated by ``echo ---`` markers) costs one fork/exec instead of one per probe.
+
+        Args:
+            script: Bash script to execute as-is.
+            context_params: Additional context parameters for this run.
+
+        Returns:
+            CommandResult: Result of the whole script (exit code of its last statement).
+        """
+        return self.execute(self.create_bash_command(script), context_params)
+
     def get_command_type_name(self, command_type: str, language: Optional[str] = None) -> str:
         """
         Gets a human-readable name for a command type in the specified language.
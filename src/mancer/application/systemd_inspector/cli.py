@@ -1,16 +1,24 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import getpass
 import sys
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from .inspector import SystemdInspector
+if TYPE_CHECKING:
+    # Import właściwy odbywa się w main() - ładuje cryptography, zbędne dla --help
+    from .inspector import SystemdInspector
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """
     Tworzy parser argumentów linii poleceń.
 
+    Parser jest budowany raz i współdzielony między wywołaniami main() -
+    parse_args() nie modyfikuje parsera, więc nie należy go zmieniać
+    (add_argument, set_defaults) po otrzymaniu.
+
     Returns:
         Skonfigurowany parser argumentów
     """
@@ -54,7 +62,7 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def command_inspect(inspector: SystemdInspector, args: argparse.Namespace) -> int:
+def command_inspect(inspector: "SystemdInspector", args: argparse.Namespace) -> int:
     """
     Obsługuje polecenie inspect - pobiera i generuje raport jednostek systemd.
 
@@ -139,7 +147,7 @@ def command_inspect(inspector: SystemdInspector, args: argparse.Namespace) -> in
     return 0
 
 
-def command_profile_add(inspector: SystemdInspector, args: argparse.Namespace) -> int:
+def command_profile_add(inspector: "SystemdInspector", args: argparse.Namespace) -> int:
     """
     Obsługuje polecenie profile add - dodaje nowy profil połączenia.
 
@@ -164,7 +172,7 @@ def command_profile_add(inspector: SystemdInspector, args: argparse.Namespace) -
     return 1
 
 
-def command_profile_list(inspector: SystemdInspector, args: argparse.Namespace) -> int:
+def command_profile_list(inspector: "SystemdInspector", args: argparse.Namespace) -> int:
     """
     Obsługuje polecenie profile list - wyświetla listę profili połączeń.
 
@@ -189,7 +197,7 @@ def command_profile_list(inspector: SystemdInspector, args: argparse.Namespace)
     return 0
 
 
-def command_profile_remove(inspector: SystemdInspector, args: argparse.Namespace) -> int:
+def command_profile_remove(inspector: "SystemdInspector", args: argparse.Namespace) -> int:
     """
     Obsługuje polecenie profile remove - usuwa profil połączenia.
 
@@ -220,6 +228,8 @@ def main(args: Optional[List[str]] = None) -> int:
     parser = create_parser()
     parsed_args = parser.parse_args(args if args is not None else sys.argv[1:])
 
+    from .inspector import SystemdInspector
+
     inspector = SystemdInspector()
 
     # Obsługa polecenia inspect
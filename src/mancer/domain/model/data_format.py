@@ -17,30 +17,24 @@ class DataFormat(Enum):
     @staticmethod
     def from_string(format_name: str) -> Optional["DataFormat"]:
         """Convert a string name to a DataFormat enum value."""
-        format_map = {
-            "polars": DataFormat.POLARS,
-            "json": DataFormat.JSON,
-            "table": DataFormat.TABLE,
-        }
-
-        if format_name.lower() not in format_map:
-            return None
-
-        return format_map[format_name.lower()]
+        return _FORMATS_BY_NAME.get(format_name.lower())
 
     @staticmethod
     def to_string(format_type: "DataFormat") -> str:
         """Convert a DataFormat enum value to its string name."""
-        format_map = {
-            DataFormat.POLARS: "polars",
-            DataFormat.JSON: "json",
-            DataFormat.TABLE: "table",
-        }
-
-        return format_map.get(format_type, "polars")
+        return _FORMAT_NAMES.get(format_type, "polars")
 
     @staticmethod
     def is_convertible(source_format: "DataFormat", target_format: "DataFormat") -> bool:
         """Return True if conversion between formats is possible."""
         # Wszystkie formaty są konwertowalne między sobą
         return True
+
+
+# Mapy nazw budowane raz przy imporcie, a nie przy każdym wywołaniu to_string/from_string
+_FORMAT_NAMES = {
+    DataFormat.POLARS: "polars",
+    DataFormat.JSON: "json",
+    DataFormat.TABLE: "table",
+}
+_FORMATS_BY_NAME = {name: format_type for format_type, name in _FORMAT_NAMES.items()}
@@ -1,11 +1,14 @@
+import heapq
 import json
 import logging
 import os
 import sys
 import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, cast
+from operator import itemgetter
+from typing import Any, Deque, Dict, List, Optional, Union, cast
 
 # Importuj nowy MancerLogger, ale obsłuż przypadki gdy nie jest dostępny (np. stary kod)
 try:
@@ -37,6 +40,7 @@ class CommandLoggerService:
     DEFAULT_LOG_FORMAT = "%(asctime)s [%(levelname)s] [%(name)s] %(message)s"
     DEFAULT_LOG_DIR = "logs"
     DEFAULT_LOG_FILE = "mancer_commands.log"
+    MAX_HISTORY_SIZE = 1000
 
     @staticmethod
     def get_instance():
@@ -56,7 +60,7 @@ class CommandLoggerService:
         self._console_enabled = True
         self._file_enabled = False
         self._initialized = False
-        self._command_history = []
+        self._command_history: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_HISTORY_SIZE)
 
         # Użyj nowego MancerLogger jeśli jest dostępny
         self._new_logger = MancerLogger.get_instance() if NEW_LOGGER_AVAILABLE else None
@@ -288,7 +292,7 @@ class CommandLoggerService:
 
         # Zaktualizuj historię
         with self._lock:
-            for entry in self._command_history:
+            for entry in reversed(self._command_history):
                 if entry.get("command", {}).get("execution_id") == command_info.get("execution_id"):
                     entry["completed"] = True
                     entry["result"] = {
@@ -316,19 +320,56 @@ class CommandLoggerService:
 
         # Stara implementacja
         with self._lock:
-            history = self._command_history
-
             if success_only:
-                history = [
+                entries: List[Dict[str, Any]] = [
                     entry
-                    for entry in history
+                    for entry in self._command_history
                     if entry.get("completed", False) and entry.get("result", {}).get("success", False)
                 ]
+            else:
+                entries = list(self._command_history)
 
             if limit is not None and limit > 0:
-                return history[-limit:]
+                return entries[-limit:]
+
+            return entries
 
-            return history.copy()
+    def get_stats_snapshot(self) -> Dict[str, Any]:
+        """
+        Zwraca statystyki wykonanych komend.
+
+        Returns:
+            Słownik z liczbą komend (total, completed, successful, failed),
+            średnim czasem wykonania (average_time) oraz listą najwolniejszych
+            komend (slowest) jako par (nazwa, czas)
+        """
+        # Jeśli dostępny jest nowy logger, użyj go - prowadzi statystyki na bieżąco
+        if self._new_logger:
+            return self._new_logger.get_stats_snapshot()
+
+        # Stara implementacja - jedno przejście po ograniczonej historii
+        with self._lock:
+            completed = successful = 0
+            time_sum = 0.0
+            named_times = []
+            for entry in self._command_history:
+                result = entry.get("result")
+                if result is None:
+                    continue
+                completed += 1
+                successful += bool(result.get("success", False))
+                execution_time = result.get("execution_time") or 0.0
+                time_sum += execution_time
+                named_times.append((entry["command"].get("command_name", ""), execution_time))
+
+            return {
+                "total": len(self._command_history),
+                "completed": completed,
+                "successful": successful,
+                "failed": completed - successful,
+                "average_time": time_sum / completed if completed else 0.0,
+                "slowest": heapq.nlargest(3, named_times, key=itemgetter(1)),
+            }
 
     def export_history(self, filepath: Optional[str] = None) -> str:
         """
@@ -1,6 +1,7 @@
 import logging
 import subprocess
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from ..model.config_manager import ConfigManager
 from ..model.tool_version import ToolVersion, ToolVersionRegistry
@@ -95,6 +96,29 @@ class ToolVersionService:
             logger.error(f"Błąd podczas wykrywania wersji {tool_name}: {str(e)}")
             return None
 
+    def detect_tool_versions(self, tool_names: List[str]) -> Dict[str, Optional[ToolVersion]]:
+        """
+        Wykrywa wersje wielu narzędzi równolegle
+
+        Każde wykrycie to osobny proces `<narzędzie> --version`, więc uruchamiamy je
+        w puli wątków - czas oczekiwania jest zbliżony do najwolniejszego narzędzia,
+        a nie do sumy wszystkich.
+
+        Args:
+            tool_names: Lista nazw narzędzi
+
+        Returns:
+            Słownik {nazwa narzędzia: ToolVersion lub None w przypadku błędu}
+        """
+        unique_names = list(dict.fromkeys(tool_names))
+        if not unique_names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(32, len(unique_names))) as executor:
+            versions = list(executor.map(self.detect_tool_version, unique_names))
+
+        return dict(zip(unique_names, versions))
+
     def _is_tool_available(self, tool_name: str) -> bool:
         """
         Sprawdza, czy narzędzie jest dostępne w systemie
@@ -1,3 +1,4 @@
+import os
 import shlex
 import subprocess
 from typing import Any, Dict, List, Optional, Tuple
@@ -6,9 +7,30 @@ from ...domain.interface.backend_interface import BackendInterface
 from ...domain.model.command_result import CommandResult
 
 
+def spawn_kwargs(working_dir: Optional[str], inherit_fds: bool = False) -> Dict[str, Any]:
+    """Popen arguments passing cwd only when it differs from the current directory.
+
+    subprocess uses posix_spawn (instead of fork+exec) only when close_fds is
+    False and no cwd is given. close_fds=False is opt-in via inherit_fds: the
+    child then inherits every inheritable descriptor of the caller, so it is
+    used only on hot paths whose own descriptors are known (Python's are
+    non-inheritable, PEP 446).
+    """
+    kwargs: Dict[str, Any] = {}
+    if inherit_fds:
+        kwargs["close_fds"] = False
+    if working_dir and os.path.abspath(working_dir) != os.getcwd():
+        kwargs["cwd"] = working_dir
+    return kwargs
+
+
 class BashBackend(BackendInterface):
     """Backend executing commands in the local bash shell."""
 
+    # Strumienie kierowane do /dev/null zamiast do potoku (nie są wtedy czytane ani dekodowane)
+    discard_stdout: bool = False
+    discard_stderr: bool = False
+
     def execute_command(
         self,
         command: str,
@@ -23,8 +45,6 @@ class BashBackend(BackendInterface):
             process_env = None
             if env_vars:
                 # Kopiujemy bieżące środowisko i dodajemy nowe zmienne
-                import os
-
                 process_env = os.environ.copy()
                 process_env.update(env_vars)
 
@@ -54,10 +74,10 @@ class BashBackend(BackendInterface):
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     stdin=subprocess.PIPE if stdin else None,
-                    cwd=working_dir,
                     env=process_env,
                     bufsize=1,  # line buffered
                     universal_newlines=True,
+                    **spawn_kwargs(working_dir),
                 )
 
                 # Jeśli mamy dane wejściowe, przekazujemy je do procesu
@@ -124,10 +144,11 @@ class BashBackend(BackendInterface):
                 command,
                 shell=True,
                 text=True,
-                capture_output=True,
-                cwd=working_dir,
+                stdout=subprocess.DEVNULL if self.discard_stdout else subprocess.PIPE,
+                stderr=subprocess.DEVNULL if self.discard_stderr else subprocess.PIPE,
                 env=process_env,
                 input=stdin,
+                **spawn_kwargs(working_dir),
             )
 
             # Parsowanie wyniku
@@ -190,8 +211,8 @@ class BashBackend(BackendInterface):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 stdin=stdin,
-                cwd=working_dir,
                 bufsize=1,  # Line buffered
+                **spawn_kwargs(working_dir),
             )
 
             # Send input data if provided and wait for completion with timeout
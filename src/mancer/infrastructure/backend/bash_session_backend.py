@@ -0,0 +1,225 @@
+import copy
+import os
+import re
+import select
+import shlex
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from ...domain.model.command_result import CommandResult
+from .bash_backend import BashBackend, spawn_kwargs
+
+# Komendy wywołujące sudo mogą pytać o hasło - nie nadają się do sesji z stdin z /dev/null
+_SUDO_PATTERN = re.compile(r"(?:^|[;&|(`\s])sudo(?:\s|$)")
+_ENV_NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+class _Session:
+    """State of one bash process, shared by a backend and its discarding() views."""
+
+    def __init__(self) -> None:
+        self.process: Optional[subprocess.Popen] = None
+        self.stderr_path: Optional[str] = None
+        # Środowisko, z którym wystartował bash - kolejne komendy dostają tylko różnice
+        self.environ: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+
+class BashSessionBackend(BashBackend):
+    """Backend executing commands in one long-lived `bash -s` process.
+
+    Each command is written to the session's stdin and its output is read back
+    up to a unique end marker, so a run costs a pipe write plus a subshell fork
+    instead of a full fork+exec of a new shell. Commands run in a `( ... )`
+    subshell, so `cd`, variables and `exit` do not leak into the session.
+
+    Each command is passed to `eval` as a single quoted word, so a syntax error
+    (e.g. an unterminated quote) fails that command with exit code 2 instead of
+    swallowing the end marker. Commands see the current os.environ, not the one
+    the session started with. Like BashBackend, commands have no time limit
+    unless context_params["timeout"] is given; a command still running after
+    that many seconds is killed together with the session.
+
+    Live output, commands fed with stdin and commands using sudo fall back to
+    BashBackend.
+    """
+
+    def __init__(self) -> None:
+        self._session = _Session()
+        self._owns_session = True
+
+    def discarding(self, stdout: bool = True, stderr: bool = True) -> "BashSessionBackend":
+        """Return a view of this session that sends the selected streams to /dev/null.
+
+        The streams are redirected once on the subshell wrapping each command, so
+        the command string itself needs no `>/dev/null 2>&1`. The view shares the
+        bash process with this backend.
+        """
+        view = copy.copy(self)
+        view._owns_session = False
+        view.discard_stdout = stdout
+        view.discard_stderr = stderr
+        return view
+
+    @property
+    def _process(self) -> Optional[subprocess.Popen]:
+        return self._session.process
+
+    def execute_command(
+        self,
+        command: str,
+        working_dir: Optional[str] = None,
+        env_vars: Optional[Dict[str, str]] = None,
+        context_params: Optional[Dict[str, Any]] = None,
+        stdin: Optional[str] = None,
+    ) -> CommandResult:
+        """Execute a command in the persistent bash session."""
+        context_params = context_params or {}
+        if (
+            stdin is not None
+            or context_params.get("live_output", False)
+            or context_params.get("requires_sudo", False)
+            or _SUDO_PATTERN.search(command)
+        ):
+            return super().execute_command(command, working_dir, env_vars, context_params, stdin)
+
+        timeout = context_params.get("timeout")
+        with self._session.lock:
+            try:
+                exit_code, raw_output, error_output = self._run(command, working_dir, env_vars, timeout)
+            except TimeoutError:
+                # Komenda wisi - zabij sesję razem z nią, następne wywołanie uruchomi nową
+                self.close(kill=True)
+                return self.parse_output(command, "", 124, f"Command timed out after {timeout} seconds: {command}")
+            except (OSError, EOFError):
+                # Sesja padła (np. zabita z zewnątrz) - następne wywołanie uruchomi nową
+                self.close()
+                return super().execute_command(command, working_dir, env_vars, context_params, stdin)
+
+        return self.parse_output(command, raw_output, exit_code, error_output)
+
+    def _run(
+        self,
+        command: str,
+        working_dir: Optional[str],
+        env_vars: Optional[Dict[str, str]],
+        timeout: Optional[float] = None,
+    ) -> Tuple[int, str, str]:
+        """Send one command to the session and collect (exit_code, stdout, stderr)."""
+        process = self._ensure_session()
+        stderr_path = self._session.stderr_path
+        assert process.stdin is not None and process.stdout is not None and stderr_path is not None
+
+        prefix = ""
+        if working_dir:
+            prefix += f"cd {shlex.quote(working_dir)} || exit 1\n"
+        prefix += self._environment_prefix(env_vars)
+
+        marker = f"__MANCER_END_{uuid.uuid4().hex}__"
+        redirects = "</dev/null"
+        if self.discard_stdout:
+            redirects += " >/dev/null"
+        redirects += " 2>/dev/null" if self.discard_stderr else f" 2>{shlex.quote(stderr_path)}"
+        script = f"(\n{prefix}eval {shlex.quote(command)}\n) {redirects}\nprintf '%s:%d\\n' {marker} $?\n"
+        process.stdin.write(script.encode())
+        process.stdin.flush()
+
+        output = self._read_until(process, f"{marker}:".encode(), timeout)
+        index = output.rindex(f"{marker}:".encode())
+        exit_code = int(output[index + len(marker) + 1 :])
+
+        error_output = ""
+        if not self.discard_stderr:
+            with open(stderr_path, "r", errors="replace") as f:
+                error_output = f.read()
+
+        return exit_code, output[:index].decode(errors="replace"), error_output
+
+    def _environment_prefix(self, env_vars: Optional[Dict[str, str]]) -> str:
+        """Build the export/unset lines turning the session environment into os.environ + env_vars."""
+        wanted = {**os.environ, **(env_vars or {})}
+        started_with = self._session.environ
+        lines = [f"unset {name}" for name in started_with if name not in wanted and _ENV_NAME_PATTERN.match(name)]
+        lines += [
+            f"export {name}={shlex.quote(str(value))}"
+            for name, value in wanted.items()
+            if started_with.get(name) != value and _ENV_NAME_PATTERN.match(name)
+        ]
+        return "".join(line + "\n" for line in lines)
+
+    @staticmethod
+    def _read_until(process: subprocess.Popen, marker: bytes, timeout: Optional[float]) -> bytes:
+        """Read the session's stdout up to and including the line starting with `marker`."""
+        assert process.stdout is not None
+        fd = process.stdout.fileno()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        data = bytearray()
+        found = -1
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if (remaining is not None and remaining <= 0) or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("bash session closed")
+            # Znacznik może być rozcięty między odczytami - szukaj od końca poprzednich danych
+            start = max(0, len(data) - len(marker))
+            data += chunk
+            if found < 0:
+                found = data.find(marker, start)
+            if found >= 0 and data.find(b"\n", found) >= 0:
+                return bytes(data)
+
+    def _ensure_session(self) -> subprocess.Popen:
+        """Start the bash session on first use (or after it died)."""
+        session = self._session
+        if session.process is None or session.process.poll() is not None:
+            fd, session.stderr_path = tempfile.mkstemp(prefix="mancer-bash-", suffix=".err")
+            os.close(fd)
+            session.environ = dict(os.environ)
+            # Osobna sesja (grupa procesów) pozwala zabić bash razem z zawieszoną komendą
+            session.process = subprocess.Popen(
+                [shutil.which("bash") or "bash", "-s"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=session.environ,
+                start_new_session=True,
+                **spawn_kwargs(None),
+            )
+        return session.process
+
+    def close(self, kill: bool = False) -> None:
+        """Terminate the bash session and remove its stderr file.
+
+        Args:
+            kill: Kill bash and every process it started instead of closing stdin and waiting.
+        """
+        session = self._session
+        process, session.process = session.process, None
+        if process is not None:
+            try:
+                if kill:
+                    os.killpg(process.pid, signal.SIGKILL)
+                if process.stdin:
+                    process.stdin.close()
+                process.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+        if session.stderr_path:
+            try:
+                os.unlink(session.stderr_path)
+            except OSError:
+                pass
+            session.stderr_path = None
+
+    def __del__(self) -> None:
+        # Widoki z discarding() nie zamykają współdzielonej sesji
+        if getattr(self, "_owns_session", False):
+            self.close()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import pathlib
+import re
 from abc import abstractmethod
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, TypeVar, Union, cast
 
 import polars as pl
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing_extensions import TypeAlias
 
 from ...domain.interface.backend_interface import BackendInterface
@@ -20,6 +21,9 @@ from .loggable_command_mixin import LoggableCommandMixin
 
 T = TypeVar("T", bound="BaseCommand")
 
+# Słowa, których powłoka nie interpretuje (brak cudzysłowów, zmiennych, globów, przekierowań)
+_PLAIN_SHELL_WORD = re.compile(r"[\w./@%+=:,!]+")
+
 # Type for command parameter values
 ParamValue: TypeAlias = Union[str, int, float, bool, pathlib.Path, List[str], None]
 
@@ -49,6 +53,9 @@ class BaseCommand(BaseModel, CommandInterface, LoggableCommandMixin):
 
     args: List[str] = Field(default_factory=list, exclude=True)  # Additional arguments (private, not serialized)
 
+    # build_command() zapamiętany przy pierwszym wykonaniu - klucz cache; clone() go zeruje
+    _cache_key: Optional[str] = PrivateAttr(default=None)
+
     def with_option(self, option: str) -> "BaseCommand":
         """Return a new instance with an added short/long option (e.g., -l)."""
         new_instance: BaseCommand = self.clone()
@@ -99,9 +106,20 @@ class BaseCommand(BaseModel, CommandInterface, LoggableCommandMixin):
         # Ensure backend and private attributes are properly copied
         new_instance.backend = self.backend
         new_instance.args = deepcopy(self.args)
+        new_instance._cache_key = None
         # model_copy preserves the type when self: T is used
         return new_instance
 
+    def cache_key(self) -> str:
+        """Return the command string used as cache key, built once per instance.
+
+        Builder methods return new instances (see clone()), so an instance's
+        command string does not change once it has been executed.
+        """
+        if self._cache_key is None:
+            self._cache_key = self.build_command()
+        return self._cache_key
+
     def build_command(self) -> str:
         """Build the command string for execution."""
         cmd_parts = []
@@ -158,6 +176,25 @@ class BaseCommand(BaseModel, CommandInterface, LoggableCommandMixin):
             )
         return cast(BackendInterface, self.backend)
 
+    def _can_run_in_process(self, backend: Any, context: CommandContext) -> bool:
+        """Check whether a trivial command may be emulated in Python instead of spawning a shell.
+
+        Only the real local BashBackend qualifies (mocked, SSH or custom backends keep
+        the subprocess path), and only without sudo, flags or a pipeline suffix.
+        """
+        return (
+            type(backend) is BashBackend
+            and context.execution_mode == ExecutionMode.LOCAL
+            and not self.requires_sudo
+            and not self.pipeline
+            and not self.flags
+        )
+
+    @staticmethod
+    def _is_plain_shell_word(word: str) -> bool:
+        """Return True if the shell would pass the word through unchanged."""
+        return bool(_PLAIN_SHELL_WORD.fullmatch(word)) and not word.startswith("-")
+
     @abstractmethod
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Execute the command (to be implemented by subclasses).
@@ -229,7 +266,7 @@ class BaseCommand(BaseModel, CommandInterface, LoggableCommandMixin):
             structured_sample = structured_output[:5] if structured_output else None
 
         result.add_to_history(
-            command_string=self.build_command(),
+            command_string=self.cache_key(),
             command_type=self.__class__.__name__,
             structured_sample=structured_sample,
         )
@@ -20,7 +20,7 @@ class CustomCommand(BaseCommand):
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Executes the custom command"""
         # Build the command string
-        command_str = self.build_command()
+        command_str = self.cache_key()
 
         # Get the appropriate backend
         backend = self._get_backend(context)
@@ -1,3 +1,4 @@
+import os
 from typing import Any, Dict, List, Optional
 
 from ....domain.model.command_context import CommandContext
@@ -20,15 +21,19 @@ class CatCommand(BaseCommand):
             stdin_data = input_result.raw_output
 
         # Budujemy komendę
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Pobieramy odpowiedni backend
         backend = self._get_backend(context)
 
-        # Wykonujemy komendę
-        exit_code, output, error = backend.execute(
-            cmd_str, input_data=stdin_data, working_dir=context.current_directory
-        )
+        # Wykonujemy komendę - zwykłe czytanie plików odbywa się w Pythonie, bez powłoki
+        in_process_output = None if stdin_data else self._read_in_process(backend, context)
+        if in_process_output is not None:
+            exit_code, output, error = 0, in_process_output, ""
+        else:
+            exit_code, output, error = backend.execute(
+                cmd_str, input_data=stdin_data, working_dir=context.current_directory
+            )
 
         # Sprawdzamy, czy komenda zakończyła się sukcesem
         success = exit_code == 0
@@ -56,6 +61,25 @@ class CatCommand(BaseCommand):
 
         return result
 
+    def _read_in_process(self, backend: Any, context: CommandContext) -> Optional[str]:
+        """Czyta pliki bezpośrednio, jeśli komenda to zwykłe `cat plik...`.
+
+        Zwraca None, gdy trzeba uruchomić prawdziwy cat (opcje, znaki specjalne
+        powłoki, błąd odczytu - wtedy komunikat błędu pochodzi z cat).
+        """
+        if self.options or self.parameters or not self.args or not self._can_run_in_process(backend, context):
+            return None
+        if not all(self._is_plain_shell_word(path) for path in self.args):
+            return None
+        try:
+            chunks = []
+            for path in self.args:
+                with open(os.path.join(context.current_directory, path)) as f:
+                    chunks.append(f.read())
+        except (OSError, UnicodeDecodeError):
+            return None
+        return "".join(chunks)
+
     # Przepisane metody buildera dla poprawnego typu zwracanego
 
     def with_option(self, option: str) -> "CatCommand":
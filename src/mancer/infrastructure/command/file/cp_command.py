@@ -15,7 +15,7 @@ class CpCommand(BaseCommand):
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Wykonuje komendę cp"""
         # Budujemy komendę z uwzględnieniem kontekstu
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Jeśli nie mamy źródła ani celu, a otrzymaliśmy wynik z poprzedniej komendy
         if "source" not in self.parameters and input_result and input_result.is_success():
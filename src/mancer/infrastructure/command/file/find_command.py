@@ -15,7 +15,7 @@ class FindCommand(BaseCommand):
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Wykonuje komendę find"""
         # Budujemy komendę
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Jeśli nie ma ścieżki w parametrach, używamy bieżącego katalogu z kontekstu
         path = self.parameters.get("path", context.current_directory)
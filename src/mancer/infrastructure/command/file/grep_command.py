@@ -1,10 +1,14 @@
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from ....domain.model.command_context import CommandContext
 from ....domain.model.command_result import CommandResult
 from ....domain.model.data_format import DataFormat
 from ..base_command import BaseCommand
 
+# Opcje, które filtrowanie w Pythonie obsługuje tak samo jak grep
+_IN_PROCESS_OPTIONS = frozenset({"-i", "-v", "-c", "-F"})
+
 
 class GrepCommand(BaseCommand):
     """Komenda grep - wyszukuje wzorce w plikach"""
@@ -25,15 +29,21 @@ class GrepCommand(BaseCommand):
             stdin_data = input_result.raw_output
 
         # Budujemy komendę
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Pobieramy odpowiedni backend
         backend = self._get_backend(context)
 
-        # Wykonujemy komendę
-        exit_code, output, error = backend.execute(
-            cmd_str, input_data=stdin_data, working_dir=context.current_directory
-        )
+        # Wykonujemy komendę - wyjście poprzedniej komendy jest już w pamięci, więc proste
+        # wzorce filtrujemy w Pythonie zamiast uruchamiać proces grep
+        in_process = self._grep_in_process(backend, context, stdin_data) if stdin_data is not None else None
+        if in_process is not None:
+            exit_code, output = in_process
+            error = ""
+        else:
+            exit_code, output, error = backend.execute(
+                cmd_str, input_data=stdin_data, working_dir=context.current_directory
+            )
 
         # Sprawdzamy, czy komenda zakończyła się sukcesem
         success = exit_code == 0
@@ -51,6 +61,37 @@ class GrepCommand(BaseCommand):
             error_message=error_message,
         )
 
+    def _grep_in_process(self, backend: Any, context: CommandContext, stdin_data: str) -> Optional[Tuple[int, str]]:
+        """Filtruje dane wejściowe skompilowanym wyrażeniem re, zwraca (kod wyjścia, wyjście).
+
+        Zwraca None, gdy trzeba uruchomić prawdziwy grep: pliki lub parametry, opcje spoza
+        -i/-v/-c/-F albo wzorzec ze znakami interpretowanymi przez powłokę.
+        """
+        if (
+            len(self.args) != 1
+            or self.parameters
+            or not _IN_PROCESS_OPTIONS.issuperset(self.options)
+            or not self._can_run_in_process(backend, context)
+            or not self._is_plain_shell_word(self.args[0])
+        ):
+            return None
+
+        regex = re.escape(self.args[0])
+        if "-F" not in self.options:
+            # Spośród znaków dopuszczalnych we wzorcu tylko kropka jest specjalna w BRE
+            regex = regex.replace(r"\.", ".")
+        compiled = re.compile(regex, re.IGNORECASE if "-i" in self.options else 0)
+        invert = "-v" in self.options
+
+        # grep dzieli wejście tylko na znakach \n (splitlines dzieliłby też na \r, \f, ...)
+        lines = stdin_data.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        matched = [line for line in lines if (compiled.search(line) is None) == invert]
+
+        output = f"{len(matched)}\n" if "-c" in self.options else "".join(line + "\n" for line in matched)
+        return (0 if matched else 1), output
+
     def _parse_output(self, raw_output: str) -> List[Dict[str, Any]]:
         """Parsuje wynik grep do listy słowników z dopasowaniami"""
         result = []
@@ -1,3 +1,5 @@
+import os
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 from ....domain.model.command_context import CommandContext
@@ -20,15 +22,19 @@ class HeadCommand(BaseCommand):
             stdin_data = input_result.raw_output
 
         # Budujemy komendę
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Pobieramy odpowiedni backend
         backend = self._get_backend(context)
 
-        # Wykonujemy komendę
-        exit_code, output, error = backend.execute(
-            cmd_str, input_data=stdin_data, working_dir=context.current_directory
-        )
+        # Wykonujemy komendę - `head -n N plik` czytamy w Pythonie, bez powłoki
+        in_process_output = None if stdin_data else self._read_in_process(backend, context)
+        if in_process_output is not None:
+            exit_code, output, error = 0, in_process_output, ""
+        else:
+            exit_code, output, error = backend.execute(
+                cmd_str, input_data=stdin_data, working_dir=context.current_directory
+            )
 
         # Sprawdzamy, czy komenda zakończyła się sukcesem
         success = exit_code == 0
@@ -84,6 +90,24 @@ class HeadCommand(BaseCommand):
 
         return result
 
+    def _read_in_process(self, backend: Any, context: CommandContext) -> Optional[str]:
+        """Czyta początek pliku bezpośrednio, jeśli komenda to zwykłe `head [-nN] plik`.
+
+        Zwraca None, gdy trzeba uruchomić prawdziwy head (wiele plików, -c, opcje,
+        znaki specjalne powłoki, błąd odczytu).
+        """
+        if self.options or len(self.args) != 1 or not self._can_run_in_process(backend, context):
+            return None
+        if set(self.parameters) - {"n"} or not str(self.parameters.get("n", "10")).isdigit():
+            return None
+        if not self._is_plain_shell_word(self.args[0]):
+            return None
+        try:
+            with open(os.path.join(context.current_directory, self.args[0])) as f:
+                return "".join(islice(f, int(self.parameters.get("n", 10))))
+        except (OSError, UnicodeDecodeError):
+            return None
+
     # Przepisane metody buildera dla poprawnego typu zwracanego
 
     def with_option(self, option: str) -> "HeadCommand":
@@ -22,7 +22,7 @@ class LsCommand(BaseCommand):
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Wykonuje komendę ls"""
         # Budujemy komendę z uwzględnieniem kontekstu
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Jeśli nie ma ścieżki w parametrach, używamy bieżącego katalogu z kontekstu
         if "path" not in self.parameters:
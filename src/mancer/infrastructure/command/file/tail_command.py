@@ -20,7 +20,7 @@ class TailCommand(BaseCommand):
             stdin_data = input_result.raw_output
 
         # Budujemy komendę
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Pobieramy odpowiedni backend
         backend = self._get_backend(context)
@@ -15,7 +15,7 @@ class NetstatCommand(BaseCommand):
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Wykonuje komendę netstat"""
         # Budujemy komendę
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Pobieramy odpowiedni backend
         backend = self._get_backend(context)
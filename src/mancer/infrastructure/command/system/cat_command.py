@@ -30,7 +30,7 @@ class CatCommand(BaseCommand):
         # BaseCommand.execute() is abstract, so we don't call super()
 
         # Zbuduj string komendy
-        command_str = self.build_command()
+        command_str = self.cache_key()
 
         # Pobierz odpowiedni backend
         backend = self._get_backend(context)
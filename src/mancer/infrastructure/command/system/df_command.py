@@ -36,7 +36,7 @@ class DfCommand(BaseCommand):
         # BaseCommand.execute() is abstract, so we don't call super()
 
         # Build the command string
-        command_str = self.build_command()
+        command_str = self.cache_key()
 
         # Get the appropriate backend
         backend = self._get_backend(context)
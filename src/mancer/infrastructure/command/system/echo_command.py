@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Any, Optional, cast
 
 from ....domain.model.command_context import CommandContext
 from ....domain.model.command_result import CommandResult
 from ....domain.model.data_format import DataFormat
+from ...backend.bash_backend import BashBackend
 from ..base_command import BaseCommand, ParamValue
 
 
@@ -26,13 +27,17 @@ class EchoCommand(BaseCommand):
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Execute the echo command."""
         # Build the command
-        cmd_str = self.build_command()
+        cmd_str = self.cache_key()
 
         # Select backend
         backend = self._get_backend(context)
 
-        # Execute command
-        result = backend.execute_command(cmd_str, working_dir=context.current_directory)
+        # Execute command - plain "echo text" is emulated in Python, without a shell
+        if self._echo_in_process(backend, context):
+            words = [word for arg in self.args for word in arg.split()]
+            result = cast(BashBackend, backend).parse_output(cmd_str, " ".join(words) + "\n", 0)
+        else:
+            result = backend.execute_command(cmd_str, working_dir=context.current_directory)
 
         # Parse result: for echo we just capture text
         if result.success:
@@ -40,6 +45,16 @@ class EchoCommand(BaseCommand):
 
         return result
 
+    def _echo_in_process(self, backend: Any, context: CommandContext) -> bool:
+        """Whether this echo can be answered without starting a shell."""
+        return (
+            self.command_str is None
+            and not self.options
+            and not self.parameters
+            and self._can_run_in_process(backend, context)
+            and all(self._is_plain_shell_word(word) for arg in self.args for word in arg.split())
+        )
+
     # Przepisane metody buildera dla poprawnego typu zwracanego
 
     def with_option(self, option: str) -> "EchoCommand":
@@ -22,7 +22,7 @@ class FindCommand(BaseCommand):
     def execute(self, context: CommandContext, input_result: Optional[CommandResult] = None) -> CommandResult:
         """Executes the find command"""
         # Build the command string
-        command_str = self.build_command()
+        command_str = self.cache_key()
 
         # Get the appropriate backend
         backend = self._get_backend(context)
@@ -31,7 +31,7 @@ class GrepCommand(BaseCommand):
         """Executes the grep command"""
 
         # Build command string based on provided parameters
-        command_str = self.build_command()
+        command_str = self.cache_key()
 
         # Handle pipeline input
         if input_result and input_result.raw_output:
@@ -1,8 +1,10 @@
-from typing import Any, List, Optional
+import socket
+from typing import Any, List, Optional, cast
 
 from ....domain.model.command_context import CommandContext
 from ....domain.model.command_result import CommandResult
 from ....domain.model.data_format import DataFormat
+from ...backend.bash_backend import BashBackend
 from ...command.base_command import BaseCommand
 
 
@@ -23,14 +25,20 @@ class HostnameCommand(BaseCommand):
         backend = self._get_backend(context)
 
         # Budujemy komendę
-        command_str = self.build_command()
-
-        # Wykonujemy komendę
-        result = backend.execute_command(
-            command_str,
-            working_dir=context.current_directory,
-            env_vars=context.environment_variables,
-        )
+        command_str = self.cache_key()
+
+        # Wykonujemy komendę - odczyt nazwy (bez opcji lub z -s) nie wymaga procesu hostname
+        if self._hostname_in_process(backend, context):
+            hostname = socket.gethostname()
+            if self.options:
+                hostname = hostname.split(".", 1)[0]
+            result = cast(BashBackend, backend).parse_output(command_str, hostname + "\n", 0)
+        else:
+            result = backend.execute_command(
+                command_str,
+                working_dir=context.current_directory,
+                env_vars=context.environment_variables,
+            )
 
         # Parsujemy wynik
         if result.is_success():
@@ -38,6 +46,19 @@ class HostnameCommand(BaseCommand):
 
         return result
 
+    def _hostname_in_process(self, backend: Any, context: CommandContext) -> bool:
+        """Czy nazwę hosta można odczytać przez socket.gethostname() zamiast uruchamiać hostname.
+
+        Opcje rozwiązujące nazwy w DNS (-f, -d, -i, ...) nadal uruchamiają hostname,
+        bo wynik resolvera w Pythonie może się od nich różnić.
+        """
+        return (
+            self.options in ([], ["-s"])
+            and not self.parameters
+            and not self.args
+            and self._can_run_in_process(backend, context)
+        )
+
     # Przepisane metody buildera dla poprawnego typu zwracanego
 
     def with_option(self, option: str) -> "HostnameCommand":
@@ -27,7 +27,7 @@ class LsCommand(BaseCommand):
         """Executes the ls command"""
 
         # Build the command string
-        command_str = self.build_command()
+        command_str = self.cache_key()
 
         # Get the appropriate backend
         backend = self._get_backend(context)
@@ -27,7 +27,7 @@ class PsCommand(BaseCommand):
         """Execute the ps command and return a structured result."""
         # BaseCommand.execute() is abstract, so we don't call super()
 
-        command_str = self.build_command()
+        command_str = self.cache_key()
         backend = self._get_backend(context)
         exit_code, output, error = backend.execute(command_str)
 
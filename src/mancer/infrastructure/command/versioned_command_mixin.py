@@ -26,17 +26,20 @@ class VersionedCommandMixin:
     # Example: {"1.x": "_parse_output_v1", "2.x": "_parse_output_v2"}
     version_adapters: ClassVar[Dict[str, str]] = {}
 
-    # Class-level tool version service
+    # Tool version service shared by all versioned commands
     _version_service: ClassVar[Optional[ToolVersionService]] = None
 
     @classmethod
     def get_version_service(cls) -> ToolVersionService:
         """
-        Returns or initializes the tool version service
+        Returns or initializes the tool version service.
+
+        The service is stored on the mixin itself rather than on each command class,
+        so configuration and detected versions are loaded once per process.
         """
-        if cls._version_service is None:
-            cls._version_service = ToolVersionService()
-        return cls._version_service
+        if VersionedCommandMixin._version_service is None:
+            VersionedCommandMixin._version_service = ToolVersionService()
+        return VersionedCommandMixin._version_service
 
     def check_tool_version(self, context: CommandContext) -> Optional[ToolVersion]:
         """
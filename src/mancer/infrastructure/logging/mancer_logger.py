@@ -1,7 +1,9 @@
+import heapq
 import os
 import threading
+from collections import deque
 from datetime import datetime
-from typing import Any, ClassVar, Dict, List, Optional, Type, Union, cast
+from typing import Any, ClassVar, Deque, Dict, List, Optional, Type, Union, cast
 
 from ...domain.service.log_backend_interface import LogBackendInterface, LogData, LogLevel
 from .icecream_backend import ICECREAM_AVAILABLE, IcecreamBackend
@@ -20,6 +22,11 @@ class MancerLogger:
     _instance: ClassVar[Optional["MancerLogger"]] = None
     _lock: ClassVar[threading.RLock] = threading.RLock()
 
+    # Maksymalna liczba wpisów historii - starsze wpisy są usuwane
+    MAX_HISTORY_SIZE: ClassVar[int] = 1000
+    # Liczba najwolniejszych komend śledzonych w statystykach
+    SLOWEST_COMMANDS: ClassVar[int] = 3
+
     @classmethod
     def get_instance(cls) -> "MancerLogger":
         """
@@ -39,8 +46,18 @@ class MancerLogger:
         """
         self._backend = self._create_backend()
         self._initialized = False
-        self._command_history = []
+        self._command_history: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_HISTORY_SIZE)
         self._pipeline_data = {}
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        """Zeruje bieżące statystyki historii komend."""
+        self._total_commands = 0
+        self._completed_commands = 0
+        self._successful_commands = 0
+        self._execution_time_sum = 0.0
+        # Kopiec (czas, nr, nazwa) z najwolniejszymi komendami - najszybsza z nich na szczycie
+        self._slowest: List[tuple] = []
 
     def _create_backend(self) -> LogBackendInterface:
         """
@@ -217,6 +234,7 @@ class MancerLogger:
         # Dodaj do historii
         with self._lock:
             self._command_history.append({"command": command_info, "completed": False})
+            self._total_commands += 1
 
         return command_info
 
@@ -268,7 +286,8 @@ class MancerLogger:
 
         # Zaktualizuj historię
         with self._lock:
-            for entry in self._command_history:
+            # Kończona komenda jest zwykle jedną z ostatnich - szukaj od końca
+            for entry in reversed(self._command_history):
                 if entry.get("command", {}).get("execution_id") == execution_id:
                     entry["completed"] = True
                     entry["result"] = {
@@ -279,6 +298,16 @@ class MancerLogger:
                     }
                     break
 
+            self._completed_commands += 1
+            if success:
+                self._successful_commands += 1
+            self._execution_time_sum += execution_time
+            slowest_entry = (execution_time, self._completed_commands, command_name)
+            if len(self._slowest) < self.SLOWEST_COMMANDS:
+                heapq.heappush(self._slowest, slowest_entry)
+            else:
+                heapq.heappushpop(self._slowest, slowest_entry)
+
     def log_command_input(self, command_name: str, data: LogData) -> None:
         """
         Loguje dane wejściowe komendy (dla pipeline).
@@ -335,19 +364,43 @@ class MancerLogger:
             Lista słowników z informacjami o komendach
         """
         with self._lock:
-            history = self._command_history
-
             if success_only:
-                history = [
+                entries: List[Dict[str, Any]] = [
                     entry
-                    for entry in history
+                    for entry in self._command_history
                     if entry.get("completed", False) and entry.get("result", {}).get("success", False)
                 ]
+            else:
+                entries = list(self._command_history)
 
             if limit is not None and limit > 0:
-                return history[-limit:]
+                return entries[-limit:]
+
+            return entries
 
-            return history.copy()
+    def get_stats_snapshot(self) -> Dict[str, Any]:
+        """
+        Zwraca statystyki wykonanych komend bez przeglądania historii.
+
+        Statystyki są aktualizowane przy każdym log_command_start/log_command_end
+        i obejmują wszystkie komendy od ostatniego clear_history(), także te,
+        które wypadły już z ograniczonej historii.
+
+        Returns:
+            Słownik z liczbą komend (total, completed, successful, failed),
+            średnim czasem wykonania (average_time) oraz listą najwolniejszych
+            komend (slowest) jako par (nazwa, czas)
+        """
+        with self._lock:
+            completed = self._completed_commands
+            return {
+                "total": self._total_commands,
+                "completed": completed,
+                "successful": self._successful_commands,
+                "failed": completed - self._successful_commands,
+                "average_time": self._execution_time_sum / completed if completed else 0.0,
+                "slowest": [(name, duration) for duration, _, name in sorted(self._slowest, reverse=True)],
+            }
 
     def get_pipeline_data(self, command_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -373,6 +426,7 @@ class MancerLogger:
         """Czyści historię komend."""
         with self._lock:
             self._command_history.clear()
+            self._reset_stats()
 
     def export_history(self, filepath: Optional[str] = None) -> str:
         """
@@ -2,6 +2,7 @@
 Unit tests for AptCommand (application layer).
 """
 
+import copy
 from unittest.mock import patch
 
 import pytest
@@ -18,6 +19,7 @@ class TestAptCommand:
     def fake_state_file(self, tmp_path, monkeypatch):
         """Redirect state file operations to a temp directory to avoid touching the real FS."""
         monkeypatch.setattr(AptCommand, "APT_STATE_FILE", str(tmp_path / "apt_state.json"))
+        monkeypatch.setattr(AptCommand, "PROBE_CACHE_FILE", str(tmp_path / "apt_probe_cache.json"))
         monkeypatch.setattr(AptCommand, "_save_state", lambda self: None)
 
     @pytest.fixture  # type: ignore[misc]
@@ -85,3 +87,52 @@ class TestAptCommand:
 
         assert not result.success
         assert result.error_message == "apt error"
+
+    def test_apt_probe_result_is_cached_on_disk(self, context):
+        """Read-only probes should be answered from the disk cache until TTL or apt state changes."""
+        probe = CommandResult(raw_output="3\n", success=True, structured_output=["3"], exit_code=0)
+        with self._patch_backend(probe) as mock_exec:
+            first = AptCommand().get_updates_count().execute(context)
+            second = AptCommand().get_updates_count().execute(context)
+
+        assert mock_exec.call_count == 1
+        assert first.raw_output == second.raw_output == "3\n"
+        assert second.success
+
+        with (
+            self._patch_backend(probe) as mock_exec,
+            patch.object(AptCommand, "_probe_cache_token", return_value=[1.0, 2.0, 3.0]),
+        ):
+            AptCommand().get_updates_count().execute(context)
+
+        mock_exec.assert_called_once()
+
+    def test_apt_probe_cache_write_failure_leaves_no_temp_file(self, tmp_path):
+        """A failed cache write must not leave *.tmp files behind."""
+        probe = CommandResult(raw_output="3\n", success=True, structured_output=["3"], exit_code=0)
+        with patch("mancer.application.commands.apt_command.json.dump", side_effect=TypeError("not serializable")):
+            AptCommand()._store_probe_result("key", [0.0], probe)
+
+        assert list(tmp_path.glob("*.tmp")) == []
+        assert not (tmp_path / "apt_probe_cache.json").exists()
+
+    def test_apt_modifying_commands_bypass_probe_cache(self, context):
+        """install() must always reach the backend."""
+        with self._patch_backend(self._success()) as mock_exec:
+            AptCommand().install("nginx").execute(context)
+            AptCommand().install("nginx").execute(context)
+
+        assert mock_exec.call_count == 2
+
+    def test_apt_clone_copies_without_reloading_state(self):
+        """clone()/copy.copy should not call __init__ and must not share builder state."""
+        base = AptCommand().with_sudo()
+
+        with patch.object(AptCommand, "_load_state") as load_state:
+            first = base.clone().install("nginx")
+            second = copy.copy(base).remove("vim")
+
+        load_state.assert_not_called()
+        assert base._params == {} and base._options == ["sudo"]
+        assert first.build_command().startswith("sudo apt install")
+        assert "remove" in second.build_command() and "install" not in second.build_command()
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+from mancer.domain.model.command_result import CommandResult
+from mancer.infrastructure.backend.bash_backend import BashBackend
 from mancer.infrastructure.command.file.grep_command import GrepCommand
 
 
@@ -189,3 +191,15 @@ class TestGrepCommand:
         # Verify stdin was passed to backend
         call_args = mock_backend.execute.call_args
         assert call_args.kwargs.get("input_data") == "line1\nmatching line\nline3\n"
+
+    def test_grep_filters_piped_input_in_process(self, context):
+        """Plain patterns over captured input are matched with re, without running grep."""
+        piped = CommandResult(raw_output="a.py\nnotes.txt\nB.PY\n", success=True, structured_output=[])
+
+        with patch.object(BashBackend, "execute") as mock_execute:
+            matched = GrepCommand().pattern(".py").ignore_case().execute(context, piped)
+            missing = GrepCommand().pattern("zzz").execute(context, piped)
+
+        mock_execute.assert_not_called()
+        assert matched.success and matched.raw_output == "a.py\nB.PY\n"
+        assert not missing.success and missing.exit_code == 1 and missing.raw_output == ""
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from mancer.domain.model.command_context import CommandContext
+from mancer.infrastructure.backend.bash_backend import BashBackend
 from mancer.infrastructure.command.file.head_command import HeadCommand
 
 
@@ -99,3 +100,15 @@ class TestHeadCommand:
         _ = HeadCommand().execute(context, input_result=input_result)
 
         assert backend.execute.call_args.kwargs["input_data"] == "cached content\n"
+
+    def test_head_plain_file_is_read_without_subprocess(self, tmp_path):
+        """`head -n N file` on the local bash backend is read in Python."""
+        (tmp_path / "file.txt").write_text("a\nb\nc\n")
+        context = CommandContext(current_directory=str(tmp_path))
+
+        with patch.object(BashBackend, "execute") as mock_execute:
+            result = HeadCommand().lines(2).file("file.txt").execute(context)
+
+        mock_execute.assert_not_called()
+        assert result.success
+        assert result.raw_output == "a\nb\n"
@@ -8,6 +8,7 @@ import pytest
 
 from mancer.domain.model.command_context import CommandContext
 from mancer.domain.model.command_result import CommandResult
+from mancer.infrastructure.backend.bash_backend import BashBackend
 from mancer.infrastructure.command.system.hostname_command import HostnameCommand
 
 
@@ -241,3 +242,18 @@ class TestHostnameCommand:
         assert not result.success
         assert result.exit_code == 1
         assert "invalid option" in result.error_message
+
+    def test_hostname_local_read_skips_subprocess(self, context):
+        """Plain hostname on the local bash backend is answered by socket.gethostname()"""
+        with (
+            patch.object(BashBackend, "execute_command") as mock_execute,
+            patch(
+                "mancer.infrastructure.command.system.hostname_command.socket.gethostname", return_value="myhost.lan"
+            ),
+        ):
+            full = HostnameCommand().execute(context)
+            short = HostnameCommand().short().execute(context)
+
+        mock_execute.assert_not_called()
+        assert full.raw_output.strip() == "myhost.lan"
+        assert short.raw_output.strip() == "myhost"
@@ -323,3 +323,19 @@ class TestLsCommandPiping:
 
         assert isinstance(chain, CommandChain)
         assert chain.is_pipeline[1] is True
+
+    @patch("mancer.infrastructure.command.base_command.BaseCommand._get_backend")
+    def test_ls_builds_command_string_once_per_instance(self, mock_get_backend, context):
+        """Repeated executions reuse the command string built on first use."""
+        mock_backend = MagicMock()
+        mock_backend.execute.return_value = (0, "file1.txt\n", "")
+        mock_get_backend.return_value = mock_backend
+
+        cmd = LsCommand().with_option("-a")
+        with patch.object(LsCommand, "build_command", autospec=True, return_value="ls -a") as build:
+            cmd.execute(context)
+            cmd.execute(context)
+
+        assert build.call_count == 1
+        assert mock_backend.execute.call_count == 2
+        assert mock_backend.execute.call_args.args[0].startswith("ls -a")
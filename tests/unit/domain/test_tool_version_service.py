@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Optional
+from unittest.mock import patch
+
+from mancer.domain.model.tool_version import ToolVersion
+from mancer.domain.service.tool_version_service import ToolVersionService
+
+
+class TestToolVersionService:
+    def test_detect_tool_versions_maps_each_tool(self) -> None:
+        service = ToolVersionService()
+
+        def fake_detect(tool_name: str) -> Optional[ToolVersion]:
+            if tool_name == "missing":
+                return None
+            return ToolVersion(name=tool_name, version="1.0", raw_version_output="1.0")
+
+        with patch.object(service, "detect_tool_version", side_effect=fake_detect) as detect:
+            versions = service.detect_tool_versions(["ls", "grep", "ls", "missing"])
+
+        assert list(versions) == ["ls", "grep", "missing"]
+        assert versions["ls"] is not None and versions["ls"].version == "1.0"
+        assert versions["missing"] is None
+        assert detect.call_count == 3  # duplicates are probed once
+
+    def test_detect_tool_versions_empty(self) -> None:
+        assert ToolVersionService().detect_tool_versions([]) == {}
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import subprocess
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mancer.infrastructure.backend.bash_backend import BashBackend
+from mancer.infrastructure.backend.bash_backend import BashBackend, spawn_kwargs
 
 """Testy jednostkowe BashBackend z pełnym mockowaniem subprocess."""
 
@@ -148,3 +149,13 @@ class TestBashBackend:
         assert "--follow-symlinks" in command
         assert "--name='*.py'" in command
         assert "-d 2" in command
+
+    def test_spawn_kwargs_posix_spawn_fast_path_is_opt_in(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        assert spawn_kwargs(None) == {}
+        assert spawn_kwargs(str(tmp_path)) == {}
+        assert spawn_kwargs("/") == {"cwd": "/"}
+        assert spawn_kwargs(str(tmp_path), inherit_fds=True) == {"close_fds": False}
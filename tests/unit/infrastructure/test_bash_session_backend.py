@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from mancer.infrastructure.backend.bash_session_backend import BashSessionBackend
+
+"""Testy jednostkowe BashSessionBackend (trwała sesja bash)."""
+
+
+@pytest.fixture()
+def backend():
+    session = BashSessionBackend()
+    yield session
+    session.close()
+
+
+class TestBashSessionBackend:
+    def test_reuses_single_process(self, backend: BashSessionBackend) -> None:
+        first = backend.execute_command("echo one")
+        process = backend._process
+        second = backend.execute_command("echo two")
+
+        assert first.raw_output == "one\n"
+        assert second.raw_output == "two\n"
+        assert backend._process is process
+
+    def test_exit_code_and_stderr(self, backend: BashSessionBackend) -> None:
+        result = backend.execute_command("echo out; echo boom >&2; exit 3")
+
+        assert not result.success
+        assert result.exit_code == 3
+        assert result.raw_output == "out\n"
+        assert result.error_message == "boom\n"
+
+    def test_output_without_trailing_newline(self, backend: BashSessionBackend) -> None:
+        result = backend.execute_command("printf abc")
+
+        assert result.success
+        assert result.raw_output == "abc"
+
+    def test_state_does_not_leak_between_commands(self, backend: BashSessionBackend) -> None:
+        backend.execute_command("cd /; export MANCER_TEST_VAR=1", working_dir="/tmp", env_vars={"FOO": "bar"})
+        result = backend.execute_command('echo "$MANCER_TEST_VAR|$FOO"; pwd', working_dir="/")
+
+        assert result.raw_output == "|\n/\n"
+
+    def test_stdin_falls_back_to_bash_backend(self, backend: BashSessionBackend) -> None:
+        with patch("mancer.infrastructure.backend.bash_backend.BashBackend.execute_command") as parent:
+            backend.execute_command("cat", stdin="data")
+
+        parent.assert_called_once()
+        assert backend._process is None
+
+    def test_discarding_view_shares_session(self, backend: BashSessionBackend) -> None:
+        quiet = backend.discarding()
+
+        result = quiet.execute_command("echo out; echo err >&2; exit 4")
+        loud = backend.execute_command("echo out")
+
+        assert result.exit_code == 4
+        assert result.raw_output == ""
+        assert not result.error_message
+        assert loud.raw_output == "out\n"
+        assert quiet._process is backend._process
+
+    def test_syntax_error_fails_only_that_command(self, backend: BashSessionBackend) -> None:
+        broken = backend.execute_command('echo "unterminated')
+        after = backend.execute_command("echo ok")
+
+        assert broken.exit_code == 2
+        assert after.raw_output == "ok\n"
+
+    def test_timeout_kills_session(self, backend: BashSessionBackend) -> None:
+        backend.execute_command("true")
+        process = backend._process
+
+        result = backend.execute_command("sleep 30", context_params={"timeout": 0.2})
+
+        assert result.exit_code == 124
+        assert process is not None and process.wait(timeout=5) is not None
+        assert backend.execute_command("echo again").raw_output == "again\n"
+
+    def test_sees_environment_changes_after_start(
+        self, backend: BashSessionBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("MANCER_REMOVED_VAR", "old")
+        backend.execute_command("true")
+        monkeypatch.setenv("MANCER_LATER_VAR", "set-later")
+        monkeypatch.delenv("MANCER_REMOVED_VAR")
+
+        result = backend.execute_command('echo "$MANCER_LATER_VAR|${MANCER_REMOVED_VAR-unset}"')
+
+        assert result.raw_output == "set-later|unset\n"
+
+    def test_sudo_falls_back_to_bash_backend(self, backend: BashSessionBackend) -> None:
+        with patch("mancer.infrastructure.backend.bash_backend.BashBackend.execute_command") as parent:
+            backend.execute_command("sudo -n true")
+
+        parent.assert_called_once()
+        assert backend._process is None
@@ -60,6 +60,30 @@ class TestCommandCache:
         assert stats["success_count"] == 1
         assert stats["error_count"] == 1
 
+    def test_statistics_track_hits_and_misses(self) -> None:
+        cache = CommandCache(max_size=5)
+        cache.store("ok", "cmd", _result("ok"))
+
+        cache.get("ok")
+        cache.get("ok")
+        cache.get("missing")
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["empty_metadata_hits"] == 2  # _result() carries no metadata
+        assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+    def test_get_many_returns_found_results_only(self) -> None:
+        cache = CommandCache(max_size=5)
+        cache.store("a", "cmd a", _result("a"))
+        cache.store("b", "cmd b", _result("b"))
+
+        found = cache.get_many(["a", "missing", "b"])
+
+        assert {cmd_id: result.raw_output for cmd_id, result in found.items()} == {"a": "a", "b": "b"}
+        assert cache.get_statistics()["misses"] == 1
+
     def test_export_data_includes_results(self) -> None:
         cache = CommandCache(max_size=2)
         cache.store("cmd", "echo", _result("ok"), metadata={"user": "dev"})
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mancer.infrastructure.logging.mancer_logger import MancerLogger
+
+
+@pytest.fixture
+def logger(monkeypatch):
+    monkeypatch.setattr(MancerLogger, "MAX_HISTORY_SIZE", 3)
+    instance = MancerLogger()
+    instance._backend = MagicMock()
+    instance._initialized = True
+    return instance
+
+
+def _run(logger: MancerLogger, name: str, duration: float, success: bool = True) -> None:
+    info = logger.log_command_start(name, name)
+    info["start_time"] -= duration
+    logger.log_command_end(info, success=success, exit_code=0 if success else 1)
+
+
+class TestMancerLogger:
+    def test_history_is_bounded_but_stats_cover_all_commands(self, logger):
+        for index, duration in enumerate([0.5, 0.1, 0.9, 0.2, 0.7]):
+            _run(logger, f"cmd{index}", duration, success=index != 1)
+
+        history = logger.get_command_history()
+        stats = logger.get_stats_snapshot()
+
+        assert [entry["command"]["command_name"] for entry in history] == ["cmd2", "cmd3", "cmd4"]
+        assert stats["total"] == stats["completed"] == 5
+        assert stats["successful"] == 4
+        assert stats["failed"] == 1
+        assert stats["average_time"] == pytest.approx(0.48, abs=0.01)
+        assert [name for name, _ in stats["slowest"]] == ["cmd2", "cmd4", "cmd0"]
+
+    def test_clear_history_resets_stats(self, logger):
+        _run(logger, "ls", 0.1)
+
+        logger.clear_history()
+
+        assert logger.get_command_history() == []
+        assert logger.get_stats_snapshot() == {
+            "total": 0,
+            "completed": 0,
+            "successful": 0,
+            "failed": 0,
+            "average_time": 0.0,
+            "slowest": [],
+        }
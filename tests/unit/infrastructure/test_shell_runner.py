@@ -47,7 +47,13 @@ def mock_logger(monkeypatch):
     fake_logger.initialize.return_value = None
     fake_logger.info.return_value = None
     fake_logger.get_command_history.return_value = []
-    monkeypatch.setattr("mancer.application.shell_runner.MancerLogger.get_instance", lambda: fake_logger)
+    # Logger pobierają runner, łańcuch komend i komendy (logowanie etapów potoku) - podmień we wszystkich
+    for module in (
+        "mancer.application.shell_runner",
+        "mancer.domain.service.command_chain_service",
+        "mancer.infrastructure.command.loggable_command_mixin",
+    ):
+        monkeypatch.setattr(f"{module}.MancerLogger.get_instance", lambda: fake_logger)
     return fake_logger
 
 
@@ -71,6 +77,17 @@ class TestShellRunner:
 
         assert command.calls == 2  # no caching in live mode
 
+    def test_execute_script_runs_single_bash_command(self):
+        runner = ShellRunner(enable_cache=False, enable_command_logging=False)
+        script = "echo TRUE; echo ---; echo chrony"
+
+        with patch.object(runner, "execute", return_value=_result("ok")) as mock_execute:
+            result = runner.execute_script(script)
+
+        assert result.raw_output == "ok"
+        mock_execute.assert_called_once()
+        assert mock_execute.call_args.args[0].build_command() == script
+
     def test_register_and_get_command_returns_clone(self):
         runner = ShellRunner(enable_command_logging=False)
         stored = DummyCommand("preconfigured")
@@ -94,3 +111,94 @@ class TestShellRunner:
         assert backend is backend_instance
         assert runner._context.execution_mode == ExecutionMode.REMOTE
         mock_logger.info.assert_called()
+
+    def test_run_pipe_connects_stages_with_os_pipes(self):
+        runner = ShellRunner(enable_command_logging=False)
+        context = runner._prepare_context()
+
+        exit_code, output, error = runner._run_pipe(["printf 'a.py\\nb.txt\\nc.py\\n'", "grep py"], context)
+
+        assert exit_code == 0
+        assert output.splitlines() == ["a.py", "c.py"]
+        assert error == ""
+
+    def test_execute_pure_pipe_chain_runs_as_os_pipeline(self):
+        runner = ShellRunner(enable_cache=False, enable_command_logging=False)
+        chain = runner.create_command("echo").text("one two").pipe(runner.create_command("grep").pattern("two"))
+
+        with patch.object(chain, "execute") as chain_execute:
+            result = runner.execute(chain)
+
+        chain_execute.assert_not_called()
+        assert result.success
+        assert result.raw_output.strip() == "one two"
+        assert result.metadata["command_chain"]["total_commands"] == 2
+
+    def test_os_pipeline_result_keeps_chain_metadata(self):
+        runner = ShellRunner(enable_cache=False, enable_command_logging=False)
+        chain = runner.create_command("echo").text("one two").pipe(runner.create_command("grep").pattern("two"))
+
+        result = runner.execute(chain)
+
+        steps = result.metadata["execution_history"]["steps"]
+        assert [step["command_type"] for step in steps] == ["EchoCommand", "GrepCommand"]
+
+    def test_run_pipe_spawn_failure_returns_error(self, tmp_path):
+        runner = ShellRunner(enable_command_logging=False)
+        context = runner._prepare_context()
+        context.current_directory = str(tmp_path / "missing")
+
+        exit_code, output, error = runner._run_pipe(["echo a", "cat"], context)
+
+        assert exit_code == -1
+        assert output == ""
+        assert "missing" in error
+
+    def test_command_key_is_memoized_and_reset_by_builder(self):
+        runner = ShellRunner(enable_command_logging=False)
+        ls = runner.create_command("ls")
+
+        with patch.object(type(ls), "build_command", autospec=True, return_value="ls") as build:
+            assert runner._command_key(ls) == "ls"
+            assert runner._command_key(ls) == "ls"
+            assert build.call_count == 1
+
+        long_ls = ls.long()
+        assert runner._command_key(long_ls) == long_ls.build_command() != "ls"
+
+    def test_create_bash_command_uses_shared_session_backend(self):
+        runner = ShellRunner(enable_command_logging=False)
+
+        first = runner.create_bash_command("echo a")
+        second = runner.create_bash_command("echo b")
+
+        assert first.backend is second.backend is runner._bash_session
+
+    def test_discarding_bash_command_has_its_own_cache_entry(self):
+        runner = ShellRunner(enable_cache=True, enable_command_logging=False)
+
+        quiet = runner.execute(runner.create_bash_command("echo hello", discard_stdout=True))
+        loud = runner.execute(runner.create_bash_command("echo hello"))
+
+        assert quiet.raw_output == ""
+        assert loud.raw_output == "hello\n"
+
+    def test_execute_batch_preserves_order(self):
+        runner = ShellRunner(enable_cache=False, enable_command_logging=False)
+        commands = [DummyCommand("first"), DummyCommand("second"), DummyCommand("third")]
+
+        results = runner.execute_batch(commands)
+
+        assert [result.raw_output for result in results] == ["first:1", "second:1", "third:1"]
+        assert runner.execute_batch([]) == []
+
+    def test_get_cache_history_returns_cached_command_ids(self):
+        runner = ShellRunner(enable_cache=True, enable_command_logging=False)
+        runner.execute(DummyCommand("first"))
+
+        history = runner.get_cache_history()
+
+        assert len(history) == 1
+        command_id, _, success = history[0]
+        assert success
+        assert runner.get_cached_result(command_id).raw_output == "first:1"
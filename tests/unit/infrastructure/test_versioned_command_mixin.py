@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from mancer.infrastructure.command.versioned_command_mixin import VersionedCommandMixin
+
+
+class _LsLike(VersionedCommandMixin):
+    tool_name = "ls"
+
+
+class _GrepLike(VersionedCommandMixin):
+    tool_name = "grep"
+
+
+class TestVersionedCommandMixin:
+    def test_version_service_is_shared_between_command_classes(self) -> None:
+        with patch.object(VersionedCommandMixin, "_version_service", None):
+            ls_service = _LsLike.get_version_service()
+            grep_service = _GrepLike.get_version_service()
+
+            assert ls_service is grep_service
+            assert "_version_service" not in vars(_LsLike)
@@ -4,43 +4,39 @@ Script to check Mancer versions installed in prototype environments.
 """
 
 import os
-import subprocess
 import sys
+from importlib.metadata import distributions
 from pathlib import Path
 
 
 def check_environment(env_path, prototype_name):
     """Check Mancer version in a given environment."""
-    activate_script = os.path.join(env_path, "bin", "activate")
+    env_path = Path(env_path)
 
-    if not os.path.exists(activate_script):
+    # Read package metadata straight from the environment's site-packages instead of
+    # starting its interpreter just to print the version
+    site_packages = [str(path) for path in env_path.glob("lib/python*/site-packages")]
+    site_packages += [str(path) for path in env_path.glob("Lib/site-packages")]
+
+    if not site_packages:
         return {
             "prototype": prototype_name,
             "status": "error",
-            "error": "Activate script not found",
+            "error": "site-packages directory not found",
         }
 
     try:
-        # Command to get Mancer version
-        cmd = (
-            f"source {activate_script} && python -c "
-            f"\"import pkg_resources; print(pkg_resources.get_distribution('mancer').version)\""
-        )
-
-        # Run the command
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, executable="/bin/bash")
-
-        if result.returncode != 0:
+        for dist in distributions(name="mancer", path=site_packages):
             return {
                 "prototype": prototype_name,
-                "status": "error",
-                "error": f"Mancer is not installed: {result.stderr.strip()}",
+                "status": "success",
+                "version": dist.version,
             }
 
         return {
             "prototype": prototype_name,
-            "status": "success",
-            "version": result.stdout.strip(),
+            "status": "error",
+            "error": "Mancer is not installed",
         }
 
     except Exception as e:
@@ -6,10 +6,14 @@ framework in development mode.
 
 import argparse
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+# rm walks and unlinks in C; shutil.rmtree stats every venv file from Python
+RM_PATH = shutil.which("rm") if sys.platform != "win32" else None
+
 
 def create_venv(venv_path):
     """Create a virtual environment at the given path."""
@@ -30,10 +34,13 @@ def create_venv(venv_path):
 
 def install_dependencies(venv_path, requirements_file=None, dev_mode=True):
     """Install dependencies in the virtual environment."""
-    activate_script = os.path.join(venv_path, "bin", "activate")
+    if sys.platform == "win32":
+        python_path = os.path.join(venv_path, "Scripts", "python.exe")
+    else:
+        python_path = os.path.join(venv_path, "bin", "python")
 
-    if not os.path.exists(activate_script):
-        print(f"Error: Activate script not found at {venv_path}")
+    if not os.path.exists(python_path):
+        print(f"Error: Python interpreter not found at {venv_path}")
         return False
 
     try:
@@ -41,8 +48,8 @@ def install_dependencies(venv_path, requirements_file=None, dev_mode=True):
         if requirements_file and os.path.exists(requirements_file):
             print(f"Installing dependencies from {requirements_file}...")
 
-            cmd = f"source {activate_script} && pip install -r {requirements_file}"
-            result = subprocess.run(cmd, shell=True, executable="/bin/bash")
+            cmd = [python_path, "-m", "pip", "install", "-r", str(requirements_file)]
+            result = subprocess.run(cmd)
 
             if result.returncode != 0:
                 print(f"Error installing dependencies from {requirements_file}")
@@ -57,8 +64,8 @@ def install_dependencies(venv_path, requirements_file=None, dev_mode=True):
             # Get path to main workspace directory (where setup.py is located)
             workspace_dir = Path(os.getcwd())
 
-            cmd = f"source {activate_script} && pip install -e {workspace_dir}"
-            result = subprocess.run(cmd, shell=True, executable="/bin/bash")
+            cmd = [python_path, "-m", "pip", "install", "-e", str(workspace_dir)]
+            result = subprocess.run(cmd)
 
             if result.returncode != 0:
                 print("Error installing Mancer in development mode")
@@ -73,6 +80,19 @@ def install_dependencies(venv_path, requirements_file=None, dev_mode=True):
         return False
 
 
+def remove_tree(path):
+    """Remove a directory tree, preferring `rm -rf` over a Python-level walk."""
+    try:
+        if RM_PATH:
+            subprocess.run([RM_PATH, "-rf", str(path)], check=True, capture_output=True)
+        else:
+            shutil.rmtree(path)
+        return True
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"Error removing {path}: {e}")
+        return False
+
+
 def setup_prototype(prototype_dir, force=False):
     """Set up a prototype with its own virtual environment and dependencies."""
     if not os.path.isdir(prototype_dir):
@@ -87,10 +107,9 @@ def setup_prototype(prototype_dir, force=False):
     venv_path = os.path.join(prototype_dir, ".venv")
 
     if os.path.exists(venv_path) and force:
-        import shutil
-
         print(f"Removing existing virtual environment at {venv_path}")
-        shutil.rmtree(venv_path)
+        if not remove_tree(venv_path):
+            return False
 
     if not create_venv(venv_path):
         return False
@@ -24,6 +24,7 @@ show_help() {
     echo "  -i, --install           Install development environment"
     echo "  -r, --run               Run Mancer application"
     echo "  -t, --test [type]       Run tests (all, unit, integration, privileged)"
+    echo "                          in parallel on cores-2 workers (--serial to disable)"
     echo "  -b, --build [format]    Build package (all, wheel, sdist)"
     echo "  -u, --uninstall         Remove development environment"
     echo "  -v, --version           Display current Mancer version"
@@ -37,6 +38,9 @@ show_help() {
     echo "  $0 --build wheel        Build package in wheel format"
     echo "  $0 --uninstall --force  Remove development environment without asking"
     echo
+    echo "Without a terminal (or with CI / MANCER_NONINTERACTIVE set) prompts answer 'no';"
+    echo "MANCER_ASSUME_YES=1 is equivalent to --force."
+    echo
 }
 
 # Function to display banner
@@ -145,7 +149,10 @@ install_dev_env() {
     if [ -d ".venv" ] || ls -d .venv-* 2>/dev/null | grep -q .; then
         if [ "$FORCE_MODE" != "true" ]; then
             echo -e "${YELLOW}Virtual environment(s) already exist.${RESET}"
-            read -rp "Do you want to replace them? [y/N]: " response
+            response="n"
+            if [ "$CAN_PROMPT" == "true" ]; then
+                read -rp "Do you want to replace them? [y/N]: " response
+            fi
             if [[ $response =~ ^[Yy]$ ]]; then
                 echo -e "${YELLOW}Removing existing environment(s)...${RESET}"
                 rm -rf .venv .venv-*
@@ -210,6 +217,56 @@ run_app() {
     fi
 }
 
+# Test dependencies as name=minimum_version pairs
+TEST_REQUIREMENTS="pytest=7.0.0 pytest-cov=4.0.0 pytest-xdist=3.0.0 pytest-mock=3.8.0"
+
+# Function printing test requirements that are missing or too old
+missing_test_requirements() {
+    python - $TEST_REQUIREMENTS <<'PYEOF'
+import sys
+from importlib.metadata import PackageNotFoundError, version
+
+
+def as_tuple(value):
+    return tuple(int(part) for part in value.split(".")[:3] if part.isdigit())
+
+
+for requirement in sys.argv[1:]:
+    name, minimum = requirement.split("=")
+    try:
+        if as_tuple(version(name)) >= as_tuple(minimum):
+            continue
+    except PackageNotFoundError:
+        pass
+    print(f"{name}>={minimum}")
+PYEOF
+}
+
+# Function installing test dependencies only when something is missing
+install_test_requirements() {
+    # Marker keyed by the requirement list, so editing it forces a re-check
+    local marker
+    marker="${VIRTUAL_ENV:-.venv}/.mancer_test_reqs_$(echo "$TEST_REQUIREMENTS" | cksum | cut -d' ' -f1)"
+    if [ -f "$marker" ]; then
+        return 0
+    fi
+
+    local missing
+    missing=$(missing_test_requirements)
+    if [ -n "$missing" ]; then
+        echo -e "${YELLOW}Installing required test packages...${RESET}"
+        # Prefer uv's resolver/installer when present, fall back to pip
+        # shellcheck disable=SC2086
+        if ! { command -v uv >/dev/null 2>&1 && uv pip install --python "$(command -v python)" $missing; }; then
+            # shellcheck disable=SC2086
+            pip install $missing || return 1
+        fi
+    fi
+
+    touch "$marker" 2>/dev/null
+    return 0
+}
+
 # Function running tests
 run_tests() {
     echo -e "${YELLOW}Running tests...${RESET}"
@@ -261,7 +318,10 @@ run_tests() {
         # Test options
         echo -e "${YELLOW}Test options:${RESET}"
         read -rp "Verbose mode? [y/N]: " verbose
-        read -rp "Parallel tests? [y/N]: " parallel
+        read -rp "Parallel tests? [Y/n]: " parallel
+        if [[ ! $parallel =~ ^[Nn]$ ]]; then
+            parallel="y"
+        fi
         read -rp "Code coverage report? [y/N]: " coverage
         
         if [[ $coverage =~ ^[Yy]$ ]]; then
@@ -269,9 +329,11 @@ run_tests() {
         fi
     fi
     
-    # Install test dependencies
-    echo -e "${YELLOW}Installing required test packages...${RESET}"
-    pip install pytest pytest-cov pytest-xdist pytest-mock
+    # Install test dependencies (skipped when already satisfied)
+    if ! install_test_requirements; then
+        echo -e "${RED}Error installing test packages.${RESET}"
+        return 1
+    fi
     
     # Building command
     cmd="python -m pytest"
@@ -289,7 +351,22 @@ run_tests() {
     fi
     
     if [[ $parallel =~ ^[Yy]$ ]]; then
-        cmd="$cmd -n auto"
+        # Leave two cores free for the editor and other foreground work
+        workers=$(( $(nproc 2>/dev/null || echo 3) - 2 ))
+        if [ "$workers" -lt 1 ]; then
+            workers=1
+        fi
+        cmd="$cmd -n $workers"
+
+        # Keep per-module fixtures of integration tests on a single worker
+        if [[ $test_type == "integration" ]]; then
+            cmd="$cmd --dist=loadfile"
+        fi
+    fi
+
+    # Workers would only contend on .pytest_cache; coverage runs keep it
+    if [[ ! $coverage =~ ^[Yy]$ ]]; then
+        cmd="$cmd -p no:cacheprovider"
     fi
     
     if [[ $coverage =~ ^[Yy]$ ]]; then
@@ -301,6 +378,12 @@ run_tests() {
     
     # Run tests
     echo -e "${YELLOW}Running tests: ${RESET}$cmd"
+
+    # From the command line nothing follows the run, so let pytest replace the
+    # shell: no extra fork, signals go straight to pytest, exit code is its own
+    if [ "$NON_INTERACTIVE" == "true" ]; then
+        eval "exec $cmd"
+    fi
     eval "$cmd"
     
     if [ $? -eq 0 ]; then
@@ -414,14 +497,17 @@ uninstall_dev_env() {
     echo -e "${YELLOW}Removing development environment...${RESET}"
     
     # Check if we're in a virtual environment
-    if [ -n "$VIRTUAL_ENV" ]; then
+    if check_venv; then
         echo -e "${RED}Cannot remove active virtual environment.${RESET}"
         echo -e "${YELLOW}First deactivate the environment with 'deactivate' command, then run the script again.${RESET}"
         return 1
     fi
     
     # Confirm removal if not in forced mode
-    if [ "$FORCE_MODE" != "true" ] && [ "$NON_INTERACTIVE" != "true" ]; then
+    if [ "$FORCE_MODE" != "true" ] && [ "$CAN_PROMPT" != "true" ]; then
+        echo -e "${YELLOW}No terminal to confirm on; environment removal cancelled (use --force or MANCER_ASSUME_YES=1).${RESET}"
+        return 1
+    elif [ "$FORCE_MODE" != "true" ]; then
         echo -e "${RED}WARNING: This operation will remove:${RESET}"
         echo "  - Python virtual environment (.venv)"
         echo "  - Installation files (*.egg-info, __pycache__, etc.)"
@@ -437,24 +523,35 @@ uninstall_dev_env() {
         echo -e "${YELLOW}Forced mode: removing without confirmation.${RESET}"
     fi
     
+    # The three removals touch disjoint trees, so run them concurrently
     # Remove environment
     if [ -d ".venv" ] || ls -d .venv-* 2>/dev/null | grep -q .; then
         echo -e "${YELLOW}Removing virtual environment(s)...${RESET}"
-        rm -rf .venv .venv-*
+        rm -rf .venv .venv-* &
     fi
     
     # Remove installation files
     echo -e "${YELLOW}Removing installation files...${RESET}"
-    rm -rf src/mancer.egg-info
-    find . -name "__pycache__" -type d -exec rm -rf {} +  2>/dev/null || true
-    find . -name "*.pyc" -delete
+    (
+        rm -rf src/mancer.egg-info
+        # Single walk: skip trees removed elsewhere or never holding our bytecode,
+        # and don't descend into __pycache__ directories that are deleted whole.
+        # Paths are only counted, so the output stays one line however many there are
+        find . \( -name .git -o -name ".venv*" -o -name node_modules -o -name build -o -name dist \) -prune \
+            -o -name "__pycache__" -type d -prune -print -exec rm -rf {} + \
+            -o -name "*.pyc" -type f -print -exec rm -f {} + 2>/dev/null \
+            | awk '/__pycache__$/ { dirs++; next } { files++ }
+                   END { printf "Removed %d __pycache__ dirs, %d .pyc files\n", dirs, files }'
+    ) &
     
     # Remove build and dist directories
     if [ -d "build" ] || [ -d "dist" ]; then
         echo -e "${YELLOW}Removing build and dist directories...${RESET}"
-        rm -rf build dist
+        rm -rf build dist &
     fi
     
+    wait
+    
     echo -e "${GREEN}Development environment successfully removed.${RESET}"
     echo -e "${YELLOW}To reinstall the environment, use option 1 in the main menu.${RESET}"
 }
@@ -591,7 +688,7 @@ set_specific_version() {
             
             if [ -n "$VERSION" ]; then
                 # Update setup.py file
-                sed -i "s/version=\"$VERSION\"/version=\"$new_version\"/" setup.py"
+                sed -i "s/version=\"$VERSION\"/version=\"$new_version\"/" setup.py
                 
                 echo -e "${GREEN}Updated version from ${YELLOW}$VERSION${GREEN} to ${YELLOW}$new_version${RESET}"
                 return 0
@@ -619,6 +716,13 @@ process_args() {
     fi
     
     NON_INTERACTIVE="true"
+
+    # --force applies to every action, so pick it up before dispatching (flag order must not matter)
+    for arg in "$@"; do
+        if [ "$arg" == "-f" ] || [ "$arg" == "--force" ]; then
+            FORCE_MODE="true"
+        fi
+    done
     
     while [ $# -gt 0 ]; do
         case "$1" in
@@ -657,7 +761,7 @@ process_args() {
                 
                 # Check additional test options
                 verbose="n"
-                parallel="n"
+                parallel="y"
                 coverage="n"
                 html_report="n"
                 
@@ -672,6 +776,10 @@ process_args() {
                             parallel="y"
                             shift
                             ;;
+                        --serial|-s)
+                            parallel="n"
+                            shift
+                            ;;
                         --coverage|-c)
                             coverage="y"
                             shift
@@ -777,6 +885,12 @@ process_args() {
 
 # Main program loop in interactive mode
 interactive_mode() {
+    # Without a terminal the menu loop would spin on EOF forever
+    if [ "$CAN_PROMPT" != "true" ]; then
+        show_help
+        exit 1
+    fi
+
     show_banner
     
     while true; do
@@ -827,6 +941,15 @@ interactive_mode() {
 # Initialize variables
 FORCE_MODE="false"
 NON_INTERACTIVE="false"
+CAN_PROMPT="true"
+
+# Never block on prompts when stdin is not a terminal (CI, pipes, editors)
+if [ ! -t 0 ] || [ -n "$CI" ] || [ -n "$MANCER_NONINTERACTIVE" ]; then
+    CAN_PROMPT="false"
+fi
+if [ "$MANCER_ASSUME_YES" == "1" ]; then
+    FORCE_MODE="true"
+fi
 
 # Run program
 process_args "$@" 
\ No newline at end of file
@@ -44,6 +44,31 @@ def find_main_script(prototype_dir):
     return None
 
 
+def venv_python(venv_path):
+    """Return the interpreter path inside the given virtual environment."""
+    if sys.platform == "win32":
+        return os.path.join(venv_path, "Scripts", "python.exe")
+    return os.path.join(venv_path, "bin", "python")
+
+
+def venv_environ(venv_path):
+    """Build the environment the venv's activate script would have produced."""
+    env = os.environ.copy()
+    path = env.get("PATH", "")
+
+    # Drop the bin dir of an already active venv; skip the split when it is absent
+    outer_bin = os.path.dirname(venv_python(env["VIRTUAL_ENV"])) if "VIRTUAL_ENV" in env else None
+    if outer_bin and outer_bin in path:
+        path = os.pathsep.join(p for p in path.split(os.pathsep) if p != outer_bin)
+
+    for var in {"VIRTUAL_ENV", "PYTHONHOME"} & env.keys():
+        del env[var]
+
+    env["VIRTUAL_ENV"] = os.path.abspath(venv_path)
+    env["PATH"] = os.path.dirname(os.path.abspath(venv_python(venv_path))) + os.pathsep + path
+    return env
+
+
 def run_prototype(prototype_dir, script_path=None, args=None):
     """Run a prototype in its own virtual environment."""
     if not os.path.isdir(prototype_dir):
@@ -56,9 +81,9 @@ def run_prototype(prototype_dir, script_path=None, args=None):
 
     # Check for virtual environment
     venv_path = os.path.join(prototype_dir, ".venv")
-    activate_script = os.path.join(venv_path, "bin", "activate")
+    python_path = venv_python(venv_path)
 
-    if not os.path.exists(activate_script):
+    if not os.path.exists(python_path):
         print(f"Error: Virtual environment not found at {venv_path}")
         print("First run install_prototype_deps.py to configure the environment")
         return False
@@ -79,14 +104,12 @@ def run_prototype(prototype_dir, script_path=None, args=None):
 
     # Run the prototype
     try:
-        # Prepare command
-        args_str = " ".join(args) if args else ""
-        script_name = os.path.basename(script_path)
-        cmd = f"cd {prototype_dir} && source {activate_script} && " f"python {script_name} {args_str}"
-
-        # Run the command
-        print(f"Executing: {os.path.basename(script_path)} {args_str}")
-        proc = subprocess.run(cmd, shell=True, executable="/bin/bash")
+        # Run the venv interpreter directly instead of sourcing activate in a shell
+        args = list(args) if args else []
+        cmd = [os.path.abspath(python_path), os.path.abspath(script_path), *args]
+
+        print(f"Executing: {os.path.basename(script_path)} {' '.join(args)}")
+        proc = subprocess.run(cmd, cwd=prototype_dir, env=venv_environ(venv_path))
 
         return proc.returncode == 0
 